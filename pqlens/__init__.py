@@ -6,15 +6,21 @@ __version__ = "0.1.0"
 __author__ = "David DeMar"
 __email__ = "pqlens@example.com"
 
-from .core.display import DataFrameDisplay
-from .core.interactive import InteractiveViewer
-# Import new modular components for advanced usage
-from .core.reader import ParquetReader
-from .formatters.simple import SimpleFormatter
-from .formatters.table import TabulateFormatter
-# Import from main module
-from .main import view_parquet_file, display_table, paged_display
-from .utils.terminal import TerminalHelper
+# Public names and the submodules that define them. They are imported on first
+# access so that importing the package (e.g. for --version) does not load pandas.
+_LAZY_EXPORTS = {
+    # Import from main module
+    "view_parquet_file": ".main",
+    "display_table": ".main",
+    "paged_display": ".main",
+    # Import new modular components for advanced usage
+    "ParquetReader": ".core.reader",
+    "DataFrameDisplay": ".core.display",
+    "InteractiveViewer": ".core.interactive",
+    "TabulateFormatter": ".formatters.table",
+    "SimpleFormatter": ".formatters.simple",
+    "TerminalHelper": ".utils.terminal",
+}
 
 __all__ = [
     "view_parquet_file",
@@ -29,3 +35,18 @@ __all__ = [
     "SimpleFormatter",
     "TerminalHelper"
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
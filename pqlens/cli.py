@@ -6,7 +6,6 @@ Command-line interface for pqlens
 import sys
 
 from . import __version__
-from .main import main as viewer_main
 
 
 def main():
@@ -16,7 +15,8 @@ def main():
         print(f"pqlens {__version__}")
         sys.exit(0)
 
-    # Delegate to the main viewer function
+    # Delegate to the main viewer function, imported here so --version stays fast
+    from .main import main as viewer_main
     viewer_main()
 
 
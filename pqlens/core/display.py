@@ -2,11 +2,14 @@
 DataFrame display logic
 """
 
+from typing import Optional
+
 import pandas as pd
 
 from ..formatters.simple import SimpleFormatter
 from ..formatters.table import TabulateFormatter
 from ..utils.validation import validate_rows_parameter
+from .reader import ParquetReader
 
 
 class DataFrameDisplay:
@@ -30,18 +33,19 @@ class DataFrameDisplay:
         else:
             self.formatter = formatter
 
-    def show_summary(self, df: pd.DataFrame) -> None:
+    def show_summary(self, df: pd.DataFrame, shape: Optional[tuple] = None) -> None:
         """
         Display DataFrame summary information.
         
         Args:
             df: DataFrame to summarize
+            shape: Shape of the whole file when df holds only its first rows
         """
         if df is None:
             print("No data to display")
             return
 
-        print(f"\nParquet file shape: {df.shape}")
+        print(f"\nParquet file shape: {shape or df.shape}")
 
         # Handle zero columns case
         if len(df.columns) == 0:
@@ -53,7 +57,8 @@ class DataFrameDisplay:
 
         print(f"\nColumn types:\n{df.dtypes}")
 
-    def show_table(self, df: pd.DataFrame, rows: int = 10) -> None:
+    def show_table(self, df: pd.DataFrame, rows: int = 10, file_path: Optional[str] = None,
+                   shape: Optional[tuple] = None) -> None:
         """
         Display a DataFrame as a nicely formatted table.
         
@@ -62,8 +67,10 @@ class DataFrameDisplay:
         Args:
             df: DataFrame to display
             rows: Number of rows to display
+            file_path: Parquet file to read the first rows from when df is None
+            shape: Shape of the whole file when df holds only its first rows
         """
-        if df is None:
+        if df is None and file_path is None:
             print("No data to display")
             return
 
@@ -74,7 +81,13 @@ class DataFrameDisplay:
             print(f"Warning: {e}, using default of 10")
             rows = 10
 
-        self.show_summary(df)
+        if df is None:
+            df, shape = self._read_head(file_path, rows)
+            if df is None:
+                # The reader has already reported why
+                return
+
+        self.show_summary(df, shape)
 
         # Handle zero columns case
         if len(df.columns) == 0:
@@ -90,7 +103,8 @@ class DataFrameDisplay:
 
         # Format the table
         try:
-            table = self.formatter.format_table(df.head(rows), showindex=True)
+            # Formatters get only the rows shown; max_rows is a hint the built-in ones also honour
+            table = self.formatter.format_table(df.head(rows), max_rows=rows, showindex=True)
             print(table)
         except Exception as e:
             # Fallback for formatter errors
@@ -98,6 +112,25 @@ class DataFrameDisplay:
             print("Falling back to basic display:")
             print(df.head(rows))
 
+    def _read_head(self, file_path: str, rows: int) -> tuple:
+        """
+        Read only the first rows of a Parquet file.
+        
+        Args:
+            file_path: Path to the Parquet file
+            rows: Number of rows to read
+            
+        Returns:
+            tuple: DataFrame with at most rows rows (None if the file could not be read),
+                   and the shape of the whole file
+        """
+        reader = ParquetReader(enable_lazy_loading=False)
+        df = reader.read_head(file_path, rows)
+        file_info = reader.get_file_info()
+        if df is None or file_info is None:
+            return df, None
+        return df, (file_info['num_rows'], len(df.columns))
+
     def _handle_edge_cases(self, df: pd.DataFrame) -> bool:
         """
         Handle common edge cases for DataFrames.
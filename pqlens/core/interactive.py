@@ -2,14 +2,22 @@
 Interactive viewer with navigation
 """
 
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from ..formatters.simple import SimpleFormatter
 from ..formatters.table import TabulateFormatter
 from ..utils.terminal import TerminalHelper
 from ..utils.validation import validate_rows_parameter
+from .reader import STRING_TYPES_MAPPER, ParquetReader, release_unused_memory
 
 # Import readchar conditionally
 try:
@@ -23,10 +31,26 @@ except ImportError:
     HAS_READCHAR = False
     readchar = None
 
+# Import wcwidth conditionally (installed alongside tabulate) to measure wide characters
+try:
+    from wcwidth import wcswidth
+except ImportError:
+    wcswidth = None
+
 
 class InteractiveViewer:
     """Interactive DataFrame viewer with arrow key navigation."""
 
+    # Invariant part of the navigation line; only the column range and memory vary per refresh
+    NAVIGATION_HINT = "Navigation: ↑↓ Move one row | Page Up/Down: Move full page | ←→ Scroll Columns | (?) Types | (Q)uit | "
+
+    # Files wider than MAX_SUMMARY_COLUMNS list only their first SUMMARY_PREVIEW_COLUMNS column types up front
+    MAX_SUMMARY_COLUMNS = 40
+    SUMMARY_PREVIEW_COLUMNS = 20
+
+    # Table styles whose layout is reproduced by _render_grid instead of calling tabulate
+    DIRECT_TABLE_FORMATS = ('grid', 'simple', 'plain', 'pipe')
+
     def __init__(self, df: pd.DataFrame = None, display=None, terminal_helper=None, parquet_reader=None, file_path: str = None):
         """
         Initialize interactive viewer with lazy loading support.
@@ -43,8 +67,25 @@ class InteractiveViewer:
         self.parquet_reader = parquet_reader
         self.file_path = file_path
         self.lazy_loading_enabled = parquet_reader is not None and file_path is not None
-        self.cached_chunks = {}  # Cache for loaded data chunks
+        self.cached_chunks = OrderedDict()  # LRU cache of decoded row groups (Arrow tables) keyed by row group index
+        self.cache_budget_bytes = 128 * 1024 * 1024  # Memory budget for cached row groups
+        self._cached_bytes = 0
         self.chunk_size = 1000  # Number of rows per chunk for lazy loading
+        self.selected_columns = None
+        self._parquet_file = None
+        self._parquet_file_path = None
+        self._row_group_offsets = None
+
+        # Background prefetch of the next row group in the scroll direction
+        self._prefetch_pool = None
+        self._prefetch_file = None
+        self._prefetch_futures = {}
+        self._last_view_start = None
+
+        # Process memory shown in the status line, probed at most every memory_probe_interval seconds
+        self.memory_probe_interval = 0.5
+        self._memory_mb = -1
+        self._memory_probed_at = None
 
         # Set up formatter
         if display is not None:
@@ -57,9 +98,19 @@ class InteractiveViewer:
             else:
                 self.formatter = SimpleFormatter()
 
+        # Resolved once: the formatter's table method, and whether the grid style can be drawn directly
+        self._format_table = self.formatter.format_table
+        self._direct_grid = isinstance(self.formatter, TabulateFormatter) and self.formatter.available
+
         # Navigation state
         self.start_row = 0
         self.left_col_idx = 0
+        self.max_coalesced_keys = 64  # Most queued keystrokes polled through readchar before a redraw
+
+        # Last drawn frame, used to redraw only the lines that changed
+        self._prev_frame = None
+        self._prev_layout = None
+        self._last_view_state = None
 
         # Display constants
         self.min_col_width = 10
@@ -69,6 +120,39 @@ class InteractiveViewer:
         self.table_border_width = 4
         self.extra_space = 10
 
+        # Column width estimates keyed by column position, visible column lists keyed
+        # by (left_col_idx, terminal_width), and column positions keyed by column names
+        self._col_width_cache = {}
+        self._visible_cols_cache = {}
+        self._column_positions_cache = {}
+
+        # Names of the columns being viewed, resolved once per session
+        self._column_names = None
+
+        # Columns holding a lazily viewed file's stored pandas index, and its range index
+        # (None when the index is stored as data columns), resolved on first use
+        self._index_columns = None
+        self._range_index = None
+
+        # Terminal size, cached while resize signals are watched and dropped on each resize
+        self._terminal_size = None
+        self._watching_resize = False
+
+        # Grid row templates keyed by (column widths, column alignments)
+        self._grid_template_cache = {}
+
+        # Recently rendered table lines keyed by (start_row, end_row, columns, table_format)
+        self._page_cache = OrderedDict()
+        self.page_cache_size = 64
+
+        # Grid cell text of in-memory columns, rendered in blocks of rows and keyed by (column position, block)
+        self._text_cache = OrderedDict()
+        self.text_block_rows = 256
+        self.text_cache_size = 256
+
+        # Rendered column types, computed once on first use
+        self._dtypes_repr = None
+
         # For lazy loading, get file info if available
         if self.lazy_loading_enabled:
             self.file_info = self.parquet_reader.get_file_info()
@@ -130,21 +214,86 @@ class InteractiveViewer:
         elif self.df.empty:
             print("\nDataFrame has columns but no data rows.")
             print(f"Columns ({len(self.df.columns)}): {list(self.df.columns)}")
-            print(f"Column types:\n{self.df.dtypes}")
+            print(f"Column types:\n{self._get_dtypes_summary()}")
             print("\nNothing to navigate in interactive mode.")
             return
 
         # Print summary information once at the beginning
         if self.lazy_loading_enabled and self.df is None:
             print(f"\nParquet file shape: ({self.file_info['num_rows']:,}, {self.file_info['num_columns']})")
-            print("Column information available on demand with lazy loading\n")
+            print(f"Column types:\n{self._get_dtypes_summary()}\n")
         else:
             print(f"\nParquet file shape: {self.df.shape}")
-            print(f"Column types:\n{self.df.dtypes}\n")
+            print(f"Column types:\n{self._get_dtypes_summary()}\n")
 
         # Start navigation
         self._handle_navigation(page_size, table_format, columns)
 
+    def _get_dtypes_repr(self) -> str:
+        """
+        Get the rendered column types, computing them only once.
+        
+        Under lazy loading the types come from the Arrow schema in the file footer,
+        so no data is read.
+        
+        Returns:
+            str: One line per column with its name and type
+        """
+        if self._dtypes_repr is None:
+            if self.df is not None:
+                self._dtypes_repr = self.df.dtypes.to_string()
+            else:
+                schema = self.file_info['schema']
+                name_width = max((len(name) for name in schema.names), default=0)
+                self._dtypes_repr = "\n".join(f"{field.name:<{name_width}}    {field.type}" for field in schema)
+        return self._dtypes_repr
+
+    def _get_dtypes_summary(self) -> str:
+        """
+        Get the column types shown before navigation starts, shortened for wide files.
+        
+        Files with more than MAX_SUMMARY_COLUMNS columns list only their first
+        SUMMARY_PREVIEW_COLUMNS types, so the whole schema is neither rendered nor
+        printed up front; '?' shows the full list while navigating.
+        
+        Returns:
+            str: One line per listed column with its name and type
+        """
+        if self.df is not None:
+            total_cols = len(self.df.columns)
+        else:
+            total_cols = len(self.file_info['schema'])
+        if total_cols <= self.MAX_SUMMARY_COLUMNS:
+            return self._get_dtypes_repr()
+
+        shown = self.SUMMARY_PREVIEW_COLUMNS
+        if self.df is not None:
+            preview = self.df.dtypes.iloc[:shown].to_string()
+        else:
+            fields = [self.file_info['schema'].field(i) for i in range(shown)]
+            name_width = max(len(field.name) for field in fields)
+            preview = "\n".join(f"{field.name:<{name_width}}    {field.type}" for field in fields)
+        return f"{preview}\n... {total_cols - shown} more columns (press '?' while navigating to list all column types)"
+
+    def _show_column_types(self) -> None:
+        """
+        Show the full list of column types a screen at a time, returning to the table on 'q'.
+        
+        The table is redrawn in full afterwards, so callers must reset _prev_frame.
+        """
+        lines = self._get_dtypes_repr().split("\n")
+        page_lines = max(1, self._get_terminal_size()[1] - 2)
+        for start in range(0, len(lines), page_lines):
+            end = min(start + page_lines, len(lines))
+            if end < len(lines):
+                prompt = f"--- Column types {start + 1}-{end} of {len(lines)}: any key for more, q to return ---"
+            else:
+                prompt = f"--- Column types {start + 1}-{end} of {len(lines)}: any key to return ---"
+            self.terminal.write(TerminalHelper.CLEAR_SCREEN + "\n".join(lines[start:end]) + "\n" + prompt)
+            keys = self._read_keys()
+            if end < len(lines) and any(key in ('q', 'Q', '\x03') for key in keys):
+                return
+
     def _handle_navigation(self, page_size: int, table_format: str, columns: list = None) -> None:
         """
         Handle the navigation loop with lazy loading support.
@@ -154,108 +303,231 @@ class InteractiveViewer:
             table_format: Table format style
             columns: Optional list of columns to display
         """
+        # Store selected columns for lazy loading, and drop layouts and text cached for
+        # an earlier session, which may have viewed different columns
+        self.selected_columns = columns
+        self._column_names = None
+        self._col_width_cache.clear()
+        self._visible_cols_cache.clear()
+        self._text_cache.clear()
+        self._page_cache.clear()
+        self._prev_frame = None
+        self._last_view_state = None
+
         if self.lazy_loading_enabled and self.df is None:
             total_rows = self.file_info['num_rows']
-            total_cols = self.file_info['num_columns']
+            total_cols = len(self._get_column_names())
         else:
             total_rows = len(self.df)
             total_cols = len(self.df.columns)
         total_pages = (total_rows + page_size - 1) // page_size  # Ceiling division
 
-        # Store selected columns for lazy loading
-        self.selected_columns = columns
+        try:
+            with self.terminal.watch_resize(self._on_terminal_resize) as watching:
+                self._terminal_size = None
+                self._watching_resize = watching
 
-        # Initial display
-        self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
+                # Initial display
+                self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
 
-        if HAS_READCHAR:
-            self._handle_arrow_key_navigation(page_size, table_format, total_rows, total_cols, total_pages)
-        else:
-            print("readchar module not available. Install with: pip install readchar")
-            print("Arrow key navigation disabled in interactive mode.")
-            self._handle_text_navigation(page_size, table_format, total_rows, total_cols, total_pages)
+                if HAS_READCHAR:
+                    self._handle_arrow_key_navigation(page_size, table_format, total_rows, total_cols, total_pages)
+                else:
+                    print("readchar module not available. Install with: pip install readchar")
+                    print("Arrow key navigation disabled in interactive mode.")
+                    self._handle_text_navigation(page_size, table_format, total_rows, total_cols, total_pages)
+        finally:
+            self._watching_resize = False
+            self.close()
+
+    def _on_terminal_resize(self) -> None:
+        """Forget the cached terminal size so the next refresh queries it again."""
+        self._terminal_size = None
+
+    def _get_terminal_size(self) -> tuple:
+        """
+        Get the terminal size, querying the terminal only after a resize.
+        
+        Outside an interactive session no resize signals are watched, so the
+        terminal is queried every time.
+        
+        Returns:
+            tuple: (width, height) in characters
+        """
+        if not self._watching_resize:
+            return tuple(self.terminal.get_size())
+        size = self._terminal_size
+        if size is None:
+            size = self._terminal_size = tuple(self.terminal.get_size())
+        return size
+
+    def close(self) -> None:
+        """Release the open Parquet file, cached row groups and the background prefetch thread."""
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_pool = None
+        self._prefetch_futures.clear()
+        self._prefetch_file = None
+        self._last_view_start = None
+        self._parquet_file = None
+        self._parquet_file_path = None
+        self.cached_chunks.clear()
+        self._cached_bytes = 0
+        self._page_cache.clear()
+        release_unused_memory()
+
+    def _build_key_actions(self, page_size: int) -> dict:
+        """
+        Build the keystroke dispatch table for arrow key navigation.
+        
+        Args:
+            page_size: Number of rows moved by page up/down
+            
+        Returns:
+            dict: Maps each key to its (row step, column step)
+        """
+        key_actions = {
+            'j': (1, 0), 'n': (1, 0),  # Down arrow alternatives
+            'k': (-1, 0), 'p': (-1, 0),  # Up arrow alternatives
+            'l': (0, 1), ' ': (0, 1),  # Right arrow alternatives
+            'h': (0, -1), 'b': (0, -1),  # Left arrow alternatives
+        }
+        named_keys = (('DOWN', 1, 0), ('UP', -1, 0), ('PAGE_DOWN', page_size, 0), ('PAGE_UP', -page_size, 0),
+                      ('RIGHT', 0, 1), ('LEFT', 0, -1))
+        key_module = getattr(readchar, 'key', None)
+        for name, row_step, col_step in named_keys:
+            key = getattr(key_module, name, None)
+            if key:
+                key_actions[key] = (row_step, col_step)
+        return key_actions
 
     def _handle_arrow_key_navigation(self, page_size: int, table_format: str,
                                      total_rows: int, total_cols: int, total_pages: int) -> None:
         """Handle arrow key navigation."""
-        while True:
-            try:
-                key = readchar.readkey()
-
-                # Map keys for navigation
-                down_keys = ('j', 'n')  # Down arrow alternatives
-                up_keys = ('k', 'p')  # Up arrow alternatives
-                right_keys = ('l', ' ')  # Right arrow alternatives
-                left_keys = ('h', 'b')  # Left arrow alternatives
-
-                # Navigation logic
-                if (hasattr(readchar, 'key') and hasattr(readchar.key, 'DOWN') and
-                    key == readchar.key.DOWN) or key in down_keys:
-                    if self.start_row < total_rows - 1:
-                        self.start_row += 1
-                        self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
+        key_actions = self._build_key_actions(page_size)
+        quit_keys = ('q', 'Q', '\x03')  # q, Q or Ctrl+C
+        start_row = self.start_row
+        left_col = self.left_col_idx
 
-                elif (hasattr(readchar, 'key') and hasattr(readchar.key, 'UP') and
-                      key == readchar.key.UP) or key in up_keys:
-                    if self.start_row > 0:
-                        self.start_row -= 1
-                        self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
+        with self.terminal.cbreak_input():
+            while True:
+                try:
+                    keys = self._read_keys()
 
-                elif (hasattr(readchar, 'key') and hasattr(readchar.key, 'PAGE_DOWN') and
-                      key == readchar.key.PAGE_DOWN):
-                    if self.start_row + page_size < total_rows:
-                        self.start_row = min(self.start_row + page_size, total_rows - page_size)
-                        self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
+                    moved = False
+                    for key in keys:
+                        if key in quit_keys:
+                            print("\nExiting interactive mode.")
+                            return
 
-                elif (hasattr(readchar, 'key') and hasattr(readchar.key, 'PAGE_UP') and
-                      key == readchar.key.PAGE_UP):
-                    if self.start_row > 0:
-                        self.start_row = max(0, self.start_row - page_size)
-                        self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
+                        if key == '?':
+                            self._show_column_types()
+                            self._prev_frame = None
+                            moved = True
+                            continue
 
-                elif (hasattr(readchar, 'key') and hasattr(readchar.key, 'RIGHT') and
-                      key == readchar.key.RIGHT) or key in right_keys:
-                    if self.left_col_idx < total_cols - 1:
-                        self.left_col_idx += 1
-                        self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
+                        action = key_actions.get(key)
+                        if action is None:
+                            continue
 
-                elif (hasattr(readchar, 'key') and hasattr(readchar.key, 'LEFT') and
-                      key == readchar.key.LEFT) or key in left_keys:
-                    if self.left_col_idx > 0:
-                        self.left_col_idx -= 1
+                        row_step, col_step = action
+                        if row_step:
+                            position = self._step_position(start_row, row_step, total_rows)
+                            moved = moved or position != start_row
+                            start_row = position
+                        else:
+                            position = self._step_position(left_col, col_step, total_cols)
+                            moved = moved or position != left_col
+                            left_col = position
+
+                    if moved:
+                        self.start_row = start_row
+                        self.left_col_idx = left_col
                         self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
 
-                elif key in ('q', 'Q', '\x03'):  # q, Q or Ctrl+C
-                    print("\nExiting interactive mode.")
+                except (AttributeError, TypeError):
+                    print("\nError reading keys. Exiting interactive mode.")
                     break
 
-            except (AttributeError, TypeError):
-                print("\nError reading keys. Exiting interactive mode.")
-                break
+    @staticmethod
+    def _step_position(position: int, step: int, limit: int) -> int:
+        """
+        Move a row or column position by a step, clamped to the navigable range.
+        
+        Forward moves stop at ``limit - step``, so a page down never runs past the last
+        full page and a single step stops at the last row or column; backward moves stop at 0.
+        
+        Args:
+            position: Current position
+            step: Signed number of rows or columns to move
+            limit: Total number of rows or columns
+            
+        Returns:
+            int: New position (unchanged if the move is not possible)
+        """
+        if step > 0:
+            return max(position, min(position + step, limit - step))
+        return max(position + step, 0)
+
+    def _read_keys(self) -> list:
+        """
+        Read the next key plus any keys already queued behind it.
+        
+        Applying a whole burst of keystrokes before redrawing means a held arrow key
+        redraws once per burst instead of falling further behind on every repeat.
+        
+        Returns:
+            list: Keys in the order typed
+        """
+        keys = self.terminal.read_keys()
+        if keys:
+            return keys
+
+        # Not a POSIX terminal: read through readchar and poll for anything still waiting
+        keys = [readchar.readkey()]
+        while len(keys) < self.max_coalesced_keys and self.terminal.input_pending():
+            keys.append(readchar.readkey())
+        return keys
 
     def _handle_text_navigation(self, page_size: int, table_format: str,
                                 total_rows: int, total_cols: int, total_pages: int) -> None:
         """Handle text-based navigation fallback."""
+        # Each command's (row step, column step)
+        commands = {
+            'n': (1, 0),  # Next row
+            'p': (-1, 0),  # Previous row
+            'b': (-page_size, 0),  # Page back
+            'r': (0, 1),  # Right column
+            'l': (0, -1),  # Left column
+        }
+
         while True:
             try:
-                user_input = input("\nNavigation: [n]ext row, [p]revious row, [f]orward page, [b]ack page, [r]ight column, [l]eft column, [q]uit: ").lower()
+                user_input = input("\nNavigation: [n]ext row, [p]revious row, [f]orward page, [b]ack page, [r]ight column, [l]eft column, [?] column types, [q]uit: ").lower()
 
                 if user_input == 'q':
                     print("\nExiting interactive mode.")
                     break
-                elif user_input == 'p' and self.start_row > 0:  # Previous row
-                    self.start_row -= 1
-                elif user_input == 'n' and self.start_row < total_rows - 1:  # Next row
-                    self.start_row += 1
-                elif user_input == 'b' and self.start_row > 0:  # Page back
-                    self.start_row = max(0, self.start_row - page_size)
-                elif user_input == 'f' and self.start_row < total_rows - page_size:  # Page forward
-                    self.start_row = min(self.start_row + page_size, total_rows - 1)
-                elif user_input == 'r' and self.left_col_idx < total_cols - 1:  # Right column
-                    self.left_col_idx += 1
-                elif user_input == 'l' and self.left_col_idx > 0:  # Left column
-                    self.left_col_idx -= 1
 
+                if user_input == '?':
+                    print(f"\nColumn types:\n{self._get_dtypes_repr()}")
+                    continue
+
+                command = commands.get(user_input)
+                if user_input == 'f':
+                    # Page forward only while a full page lies ahead, possibly landing on a partial
+                    # last page (unlike arrow-key page down, which stops at the last full page)
+                    if self.start_row < total_rows - page_size:
+                        self.start_row += page_size
+                elif command is not None:
+                    row_step, col_step = command
+                    if row_step:
+                        self.start_row = self._step_position(self.start_row, row_step, total_rows)
+                    else:
+                        self.left_col_idx = self._step_position(self.left_col_idx, col_step, total_cols)
+
+                # The prompt and typed input scrolled the screen, so redraw in full
+                self._prev_frame = None
                 self._refresh_display(page_size, table_format, total_rows, total_cols, total_pages)
 
             except (EOFError, KeyboardInterrupt):
@@ -265,8 +537,24 @@ class InteractiveViewer:
     def _refresh_display(self, page_size: int, table_format: str,
                          total_rows: int, total_cols: int, total_pages: int) -> None:
         """Refresh the display with current navigation state and lazy loading."""
-        # Clear screen
-        self.terminal.clear_screen()
+        # Nothing to do if the same view is already on screen
+        view_state = (self.start_row, self.left_col_idx, page_size, table_format, self._get_terminal_size())
+        if self._prev_frame is not None and view_state == self._last_view_state:
+            return
+
+        lines = self._render_frame(page_size, table_format, total_rows, total_cols, total_pages)
+        self._draw_frame(lines)
+        self._last_view_state = view_state
+
+    def _render_frame(self, page_size: int, table_format: str,
+                      total_rows: int, total_cols: int, total_pages: int) -> list:
+        """
+        Render the current view as a list of screen lines.
+        
+        Returns:
+            list: Lines making up the frame, top to bottom
+        """
+        lines = []
 
         # Get row indices for current view
         end_idx = min(self.start_row + page_size, total_rows)
@@ -274,50 +562,180 @@ class InteractiveViewer:
         # Calculate current page number for display purposes
         current_page = self.start_row // page_size
 
-        # Get data for current view (lazy loading if enabled)
-        view_df = self._get_view_data(self.start_row, end_idx)
-
-        if view_df is None:
-            print("Error loading data for current view")
-            return
-
-        # Get columns that fit in the current terminal width
-        visible_cols = self._get_visible_columns(view_df)
+        # Get columns that fit in the current terminal width (from schema metadata, before reading any rows)
+        try:
+            column_names = self._get_column_names()
+            visible_cols = self._get_visible_columns()
+        except Exception:
+            lines.append("Error loading data for current view")
+            return lines
 
         # Display page header and navigation info with memory usage
         memory_info = ""
         if self.parquet_reader:
-            current_memory = self.parquet_reader.get_memory_usage_mb()
+            current_memory = self._get_memory_usage_mb()
             if current_memory > 0:
                 memory_info = f" | Memory: {current_memory:.1f}MB"
 
-        print(f"\n--- Showing rows {self.start_row + 1}-{end_idx} of {total_rows:,} (Page {current_page + 1}/{total_pages}) ---")
+        lines.append("")
+        lines.append(f"--- Showing rows {self.start_row + 1}-{end_idx} of {total_rows:,} (Page {current_page + 1}/{total_pages}) ---")
         col_range_text = f"Columns {self.left_col_idx + 1}-{self.left_col_idx + len(visible_cols)} of {total_cols}"
-        print(f"Navigation: ↑↓ Move one row | Page Up/Down: Move full page | ←→ Scroll Columns | (Q)uit | {col_range_text}{memory_info}\n")
+        lines.append(f"{self.NAVIGATION_HINT}{col_range_text}{memory_info}")
+        lines.append("")
 
-        # Select only visible columns for display
+        # Read only the visible columns for the current rows (lazy loading if enabled)
         if visible_cols and len(visible_cols) > 0:  # If we have any visible data columns
-            display_df = view_df.iloc[:, visible_cols]
-            try:
-                # Format the DataFrame to control column widths
-                formatted_df = self._format_for_display(display_df)
-                table_output = self.formatter.format_table(formatted_df, style=table_format, showindex=True)
-                print(table_output)
-            except Exception:
-                # Fallback to basic DataFrame display if formatter fails
-                print(display_df)
+            table_lines = self._render_table(self.start_row, end_idx, [column_names[i] for i in visible_cols], table_format)
+            if table_lines is None:
+                return ["Error loading data for current view"]
+            lines.extend(table_lines)
         else:
             # If no data columns can be displayed, just show row numbers
             try:
-                empty_table = self.formatter.format_table(pd.DataFrame(), style=table_format, showindex=True)
-                print(empty_table)
+                empty_table = self._format_table(pd.DataFrame(), style=table_format, showindex=True)
+                lines.extend(empty_table.split("\n"))
             except Exception:
-                print("Row indices:", list(view_df.index))
-            print("\nTerminal too narrow to display any data columns. Resize terminal or use horizontal scrolling.")
+                lines.append(f"Row indices: {list(range(self.start_row, end_idx))}")
+            lines.append("")
+            lines.append("Terminal too narrow to display any data columns. Resize terminal or use horizontal scrolling.")
+
+        return lines
+
+    def _render_table(self, start_row: int, end_row: int, columns: list, table_format: str) -> Optional[list]:
+        """
+        Render the table for a row range and set of columns, reusing recently rendered pages.
+        
+        Args:
+            start_row: Starting row index
+            end_row: Ending row index
+            columns: Names of the columns to show
+            table_format: Table format style
+            
+        Returns:
+            list: Table lines, or None if the data could not be loaded
+        """
+        key = (start_row, end_row, tuple(columns), table_format)
+        table_lines = self._page_cache.get(key)
+        if table_lines is not None:
+            self._page_cache.move_to_end(key)
+            return table_lines
+
+        display_df = self._get_view_data(start_row, end_row, columns=columns)
+        if display_df is None:
+            return None
+        try:
+            # Plain rule-and-padding styles are rendered directly; others go through the formatter
+            table_lines = None
+            if table_format in self.DIRECT_TABLE_FORMATS and self._direct_grid:
+                table_lines = self._render_grid(display_df, start_row, table_format)
+            if table_lines is None:
+                # Format the DataFrame to control column widths
+                formatted_df = self._format_for_display(display_df)
+                table_lines = self._format_table(formatted_df, style=table_format, showindex=True).split("\n")
+        except Exception:
+            # Fallback to basic DataFrame display if formatter fails
+            table_lines = str(display_df).split("\n")
 
-    def _get_visible_columns(self, df):
+        self._page_cache[key] = table_lines
+        if len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last=False)
+        return table_lines
+
+    def _get_memory_usage_mb(self) -> float:
+        """
+        Get process memory usage for the status line, probing the reader at most once per interval.
+        
+        Returns:
+            float: Memory usage in MB from the latest probe, or -1 if unable to determine
+        """
+        now = time.monotonic()
+        if self._memory_probed_at is None or now - self._memory_probed_at >= self.memory_probe_interval:
+            self._memory_mb = self.parquet_reader.get_memory_usage_mb()
+            self._memory_probed_at = now
+        return self._memory_mb
+
+    def _draw_frame(self, lines: list) -> None:
+        """
+        Draw a rendered frame, rewriting only the lines that changed since the last frame.
+        
+        Falls back to a full clear-and-redraw on the first frame, after the terminal is
+        resized, when line wrapping changes the screen layout, when the frame is taller
+        than the terminal (the top has scrolled away, so screen lines no longer match frame lines),
+        or when a line's display width cannot be measured (non-ASCII text without wcwidth).
+        
+        Args:
+            lines: Frame lines as returned by _render_frame
+        """
+        terminal_width, terminal_height = self._get_terminal_size()
+        widths = [self._display_width(line) for line in lines]
+        measured = None not in widths
+        heights = [max(1, -(-(width or 0) // terminal_width)) if terminal_width > 0 else 1 for width in widths]
+        layout = (terminal_width, terminal_height, heights)
+
+        prev_lines = self._prev_frame
+        prev_layout = self._prev_layout
+        # The cursor is parked on the line below the frame, so that line must fit on screen too
+        fits_on_screen = sum(heights) < terminal_height
+        if (prev_lines is None or prev_layout is None or prev_layout[:2] != layout[:2] or not fits_on_screen
+                or not measured):
+            parts = [TerminalHelper.CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            parts = []
+            prev_heights = prev_layout[2]
+            screen_row = 1
+            for i, line in enumerate(lines):
+                if i >= len(prev_lines) or prev_lines[i] != line or prev_heights[i] != heights[i]:
+                    if i < len(prev_heights) and prev_heights[i] != heights[i]:
+                        # Wrapping changed from here on, so everything below moves
+                        parts.append(TerminalHelper.move_to_line(screen_row))
+                        parts.append(TerminalHelper.CLEAR_TO_END)
+                        parts.append("\n".join(lines[i:]))
+                        parts.append("\n")
+                        break
+                    parts.append(TerminalHelper.move_to_line(screen_row))
+                    parts.append(TerminalHelper.CLEAR_LINE)
+                    parts.append(line)
+                screen_row += heights[i]
+            else:
+                # Clear anything left over from a taller previous frame and park the cursor below the frame
+                parts.append(TerminalHelper.move_to_line(screen_row))
+                if len(prev_lines) > len(lines):
+                    parts.append(TerminalHelper.CLEAR_TO_END)
+
+        # Bracket the frame so the terminal shows it all at once instead of line by line
+        self.terminal.write(TerminalHelper.BEGIN_SYNC + "".join(parts) + TerminalHelper.END_SYNC)
+        self._prev_frame = lines
+        # A frame whose wrapping could not be measured is never diffed against
+        self._prev_layout = layout if measured else None
+
+    @staticmethod
+    def _display_width(line: str) -> Optional[int]:
+        """
+        Get the number of terminal cells a line occupies.
+        
+        Wide characters (e.g. CJK or emoji) take two cells each, so non-ASCII lines are
+        measured with wcwidth when it is installed.
+        
+        Args:
+            line: Frame line without ANSI sequences
+            
+        Returns:
+            int: Display width, or None if it cannot be determined
+        """
+        if line.isascii():
+            return len(line)
+        if wcswidth is None:
+            return None
+        width = wcswidth(line)
+        return width if width >= 0 else None
+
+    def _get_visible_columns(self):
         """Determine which columns can fit in the current terminal width."""
-        terminal_width, _ = self.terminal.get_size()
+        terminal_width, _ = self._get_terminal_size()
+
+        cache_key = (self.left_col_idx, terminal_width)
+        if cache_key in self._visible_cols_cache:
+            return self._visible_cols_cache[cache_key]
 
         # Start with the row number column which is always visible
         available_width = (terminal_width - self.row_num_width - self.separator_width -
@@ -325,18 +743,12 @@ class InteractiveViewer:
 
         visible_cols = []
         col_idx = self.left_col_idx  # Start from current horizontal scroll position
-        total_cols = len(df.columns)
+        total_cols = len(self._get_column_names())
+        col_width_cache = self._col_width_cache
 
         # Add columns until we run out of space
         while col_idx < total_cols and available_width > self.min_col_width:
-            col_name = df.columns[col_idx]
-            # Get sample values to estimate column width
-            sample_values = df.iloc[:min(10, len(df)), col_idx].astype(str)
-            max_data_width = sample_values.str.len().max() if len(sample_values) > 0 else 0
-
-            # Estimate column width (max of column name and data width, capped at max_col_width)
-            col_width = (min(max(len(str(col_name)), max_data_width, self.min_col_width),
-                             self.max_col_width) + self.separator_width)
+            col_width = col_width_cache.get(col_idx) or self._get_column_width(col_idx)
 
             if available_width >= col_width:
                 visible_cols.append(col_idx)
@@ -345,62 +757,470 @@ class InteractiveViewer:
             else:
                 break
 
+        self._visible_cols_cache[cache_key] = visible_cols
         return visible_cols
 
+    def _get_column_width(self, col_idx: int) -> int:
+        """
+        Get the estimated display width of a column, computing it only on first use.
+        
+        The estimate is sampled once per column (from the DataFrame, or from the first
+        rows of just that column under lazy loading) and reused on every refresh.
+        
+        Args:
+            col_idx: Column position
+            
+        Returns:
+            int: Estimated column width including the separator
+        """
+        col_width = self._col_width_cache.get(col_idx)
+        if col_width is None:
+            col_name = self._get_column_names()[col_idx]
+            # Get sample values to estimate column width
+            if self.df is not None:
+                sample_values = self._stringify(self.df.iloc[:10, col_idx])
+                max_data_width = max(map(len, sample_values), default=0)
+            else:
+                max_data_width = self._max_text_length(self._read_column_sample(col_name))
+
+            # Estimate column width (max of column name and data width, capped at max_col_width)
+            col_width = (min(max(len(str(col_name)), max_data_width, self.min_col_width),
+                             self.max_col_width) + self.separator_width)
+            self._col_width_cache[col_idx] = col_width
+        return col_width
+
+    def _get_column_names(self) -> list:
+        """
+        Get the names of the columns being viewed.
+        
+        Under lazy loading these come from the Parquet schema, so no data is read.
+        The list is built once and reused on every refresh.
+        
+        Returns:
+            list: Column names in display order
+        """
+        if self._column_names is None:
+            if self.df is not None:
+                self._column_names = list(self.df.columns)
+            elif self.selected_columns:
+                self._column_names = list(self.selected_columns)
+            else:
+                # Stored index columns become the row labels, not viewed columns
+                index_columns = set(self._get_index_columns())
+                self._column_names = [name for name in self._get_parquet_file().schema_arrow.names
+                                      if name not in index_columns]
+        return self._column_names
+
+    def _get_index_columns(self) -> list:
+        """
+        Get the names of the columns holding the file's stored pandas index.
+        
+        These are read alongside the viewed columns so each page keeps the file's
+        row labels. A range index is stored in the metadata only and has no columns.
+        
+        Returns:
+            list: Stored index column names (empty for a range index or a file without pandas metadata)
+        """
+        if self._index_columns is None:
+            pandas_metadata = self._get_parquet_file().schema_arrow.pandas_metadata or {}
+            self._index_columns = [name for name in pandas_metadata.get('index_columns', [])
+                                   if isinstance(name, str)]
+            self._range_index = ParquetReader._file_range_index(self.file_info)
+        return self._index_columns
+
+    def _read_column_sample(self, col_name: str, sample_rows: int = 10) -> pa.Array:
+        """
+        Read the first rows of a single column for width estimation.
+        
+        Args:
+            col_name: Column to sample
+            sample_rows: Number of rows to read
+            
+        Returns:
+            pa.Array: Sampled values (empty if the file has no rows)
+        """
+        parquet_file = self._get_parquet_file()
+        batch = next(parquet_file.iter_batches(batch_size=sample_rows, columns=[col_name]), None)
+        if batch is None:
+            return pa.array([], type=parquet_file.schema_arrow.field(col_name).type)
+        return batch.column(0)
+
+    @staticmethod
+    def _max_text_length(values: pa.Array) -> int:
+        """
+        Get the length of the longest value once rendered as text, using Arrow compute kernels.
+        
+        Types Arrow cannot cast to strings (e.g. nested types) are measured through pandas instead.
+        
+        Args:
+            values: Values to measure
+            
+        Returns:
+            int: Longest text length, or 0 if there are no non-null values
+        """
+        try:
+            text = values if pa.types.is_string(values.type) else pc.cast(values, pa.string())
+            longest = pc.max(pc.utf8_length(text)).as_py()
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+            sample_values = values.to_pandas().astype(str)
+            longest = sample_values.str.len().max() if len(sample_values) > 0 else 0
+        return longest or 0
+
     def _format_for_display(self, df: pd.DataFrame) -> pd.DataFrame:
         """Format DataFrame for display with proper column width handling."""
-        formatted_df = df.copy()
+        headers = [self._truncate_header(col) for col in df.columns]
+
+        # Stringify column by column (keeping pandas' per-dtype formatting), then truncate all cells at once
+        cells = np.empty(df.shape, dtype=object)
+        for pos in range(df.shape[1]):
+            cells[:, pos] = self._stringify(df.iloc[:, pos])
+
+        return pd.DataFrame(self._truncate_cells(cells), index=df.index, columns=headers, copy=False)
+
+    @staticmethod
+    def _stringify(values: pd.Series) -> np.ndarray:
+        """
+        Render a column's values as text, the way ``astype(str)`` would.
+        
+        Arrow-backed string columns (as produced by lazy loading) and plain integer columns are
+        converted with Arrow kernels, whose output matches pandas for those types; other types
+        keep pandas' formatting.
+        
+        Args:
+            values: Column to render
+            
+        Returns:
+            np.ndarray: New writable object array of strings
+        """
+        dtype = values.dtype
+        if isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow':
+            text = pc.fill_null(pa.array(values), str(dtype.na_value))
+        elif isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+            text = pc.cast(pa.array(values.to_numpy()), pa.string())
+        else:
+            return values.astype(str).to_numpy(dtype=object, copy=True)
+        return text.to_numpy(zero_copy_only=False)
+
+    def _truncate_header(self, col) -> str:
+        """Truncate a column header to the maximum column width."""
+        col_name = str(col)
+        if len(col_name) > self.max_col_width:
+            col_name = col_name[:self.max_col_width - 3] + '...'
+        return col_name
+
+    def _truncate_cells(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Truncate string cells longer than the maximum column width, in place.
+        
+        The array is flattened so the length check runs once over every cell rather than once per column.
+        
+        Args:
+            cells: Object array of strings, of any shape
+            
+        Returns:
+            np.ndarray: The same array, with long values cut and ending in '...'
+        """
+        max_width = self.max_col_width
+        flat = cells.reshape(-1)
+        too_long = np.fromiter(map(len, flat), dtype=np.int64, count=flat.size) > max_width
+        if too_long.any():
+            flat[too_long] = [value[:max_width - 3] + '...' for value in flat[too_long]]
+        return cells
+
+    def _render_grid(self, df: pd.DataFrame, start_row: Optional[int] = None,
+                     table_format: str = 'grid') -> Optional[list]:
+        """
+        Render a page in one of tabulate's DIRECT_TABLE_FORMATS without going through tabulate.
+        
+        Numeric columns are right aligned, with floats in tabulate's default 'g' format and
+        aligned on the decimal point; everything else is left aligned as text. The row
+        template for a given set of column widths is built once and reused while scrolling.
+        
+        Args:
+            df: DataFrame holding the rows and columns to show
+            start_row: Position of the page's first row in the viewed DataFrame, which lets
+                       cell text be served from the per-column text cache
+            table_format: Table format style, one of DIRECT_TABLE_FORMATS
+            
+        Returns:
+            list: Table lines, or None if the page needs tabulate (no rows, multi-line cells,
+                  non-ASCII text, text with leading or trailing whitespace, or text columns
+                  that tabulate would parse as numbers)
+        """
+        if len(df) == 0:
+            return None
+
+        # The index is typed like a column: numbers right aligned (floats as 'g'), labels left
+        index_kind = self._numeric_kind(df.index)
+        if index_kind == 'f':
+            index_text = self._align_decimals(self._cell_text(df.index, index_kind))
+        else:
+            index_text = [str(idx) for idx in df.index]
+        headers = ['']
+        cells = [index_text]
+        aligns = ['>' if index_kind else '<']
+        for pos, col in enumerate(df.columns):
+            source = df.iloc[:, pos]
+            numeric_kind = self._numeric_kind(source)
+            if start_row is not None and self._can_cache_text(source):
+                values = self._get_cached_text(col, numeric_kind, start_row, start_row + len(df))
+            else:
+                values = self._cell_text(source, numeric_kind)
+            if numeric_kind == 'f':
+                values = self._align_decimals(values)
+            headers.append(self._truncate_header(col))
+            cells.append(values)
+            aligns.append('>' if numeric_kind else '<')
+
+        if any('\n' in value for column in cells for value in column) or any('\n' in header for header in headers):
+            return None
+        # Widths are plain character counts; tabulate measures wide characters (e.g. CJK) with wcwidth
+        if not all(''.join(column).isascii() for column in cells) or not ''.join(map(str, headers)).isascii():
+            return None
+        # tabulate right-aligns and reformats text that parses as numbers (e.g. '1,000' or '3.50'),
+        # and strips whitespace around text
+        if any(align == '<' and (self._has_outer_whitespace(column) or self._is_numeric_text(column))
+               for align, column in zip(aligns, cells)):
+            return None
+
+        widths = tuple(max(len(header) + 2, max(map(len, column))) for header, column in zip(headers, cells))
+        row_format, line_above, line_below_header, line_between_rows = self._get_grid_templates(
+            widths, tuple(aligns), table_format)
+
+        lines = [row_format.format(*headers)]
+        if line_above:
+            lines.insert(0, line_above)
+        if line_below_header:
+            lines.append(line_below_header)
+        for row in zip(*cells):
+            lines.append(row_format.format(*row))
+            if line_between_rows:
+                lines.append(line_between_rows)
+        if table_format in ('simple', 'plain'):
+            # Without a closing border, tabulate drops the padding at the end of each line
+            lines = [line.rstrip() for line in lines]
+        return lines
+
+    def _cell_text(self, values: pd.Series, numeric_kind: Optional[str]) -> list:
+        """
+        Render cells as grid text: floats in the 'g' format, everything else stringified and truncated.
+        
+        Args:
+            values: Cells to render
+            numeric_kind: Column kind from _numeric_kind
+            
+        Returns:
+            list: Cell text, before decimal alignment
+        """
+        if numeric_kind == 'f':
+            return np.char.mod('%g', values.to_numpy(dtype=np.float64, na_value=np.nan)).tolist()
+        return self._truncate_cells(self._stringify(values)).tolist()
+
+    def _can_cache_text(self, values: pd.Series) -> bool:
+        """
+        Check whether a column's cell text can be rendered in blocks independently of the page.
+        
+        Only in-memory frames with unique column names qualify, and only for NumPy dtypes whose
+        text depends on each value alone (pandas prints datetimes differently depending on
+        the other values, and nullable columns change kind when a page holds missing values).
+        
+        Args:
+            values: Page of the column
+            
+        Returns:
+            bool: True if the column's text may be served from the text cache
+        """
+        return (self.df is not None and self.df.columns.is_unique and
+                isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biufO')
+
+    def _get_cached_text(self, col, numeric_kind: Optional[str], start_row: int, end_row: int) -> list:
+        """
+        Get the grid text of one in-memory column for a row range.
+        
+        Rows are rendered in fixed blocks of text_block_rows that stay cached, so scrolling
+        within a block only slices already rendered text.
+        
+        Args:
+            col: Column name
+            numeric_kind: Column kind from _numeric_kind
+            start_row: First row position
+            end_row: Row position after the last row
+            
+        Returns:
+            list: Cell text, before decimal alignment
+        """
+        block_rows = self.text_block_rows
+        col_pos = self.df.columns.get_loc(col)
+        text = []
+        for block in range(start_row // block_rows, (end_row - 1) // block_rows + 1):
+            block_start = block * block_rows
+            key = (col_pos, block)
+            block_text = self._text_cache.get(key)
+            if block_text is None:
+                block_text = self._cell_text(self.df.iloc[block_start:block_start + block_rows, col_pos], numeric_kind)
+                self._text_cache[key] = block_text
+                if len(self._text_cache) > self.text_cache_size:
+                    self._text_cache.popitem(last=False)
+            else:
+                self._text_cache.move_to_end(key)
+            text.extend(block_text[max(start_row - block_start, 0):end_row - block_start])
+        return text
+
+    def _get_grid_templates(self, widths: tuple, aligns: tuple, table_format: str = 'grid') -> tuple:
+        """
+        Get the row format string and rule lines for a table with the given column layout.
+        
+        Args:
+            widths: Content width of each column
+            aligns: Format alignment character ('<' or '>') of each column
+            table_format: Table format style, one of DIRECT_TABLE_FORMATS
+            
+        Returns:
+            tuple: (row format string, line above the header, line below the header,
+                    line after each row), with None for lines the style does not draw
+        """
+        key = (widths, aligns, table_format)
+        templates = self._grid_template_cache.get(key)
+        if templates is None:
+            if len(self._grid_template_cache) >= 256:
+                self._grid_template_cache.clear()
+            fields = [f"{{:{align}{width}}}" for width, align in zip(widths, aligns)]
+            if table_format in ('grid', 'pipe'):
+                row_format = "| " + " | ".join(fields) + " |"
+            else:
+                row_format = "  ".join(fields)
+
+            if table_format == 'grid':
+                separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+                templates = (row_format, separator, separator.replace("-", "="), separator)
+            elif table_format == 'pipe':
+                # Colons mark each column's alignment
+                rules = [":" + "-" * (width + 1) if align == '<' else "-" * (width + 1) + ":"
+                         for width, align in zip(widths, aligns)]
+                templates = (row_format, None, "|" + "|".join(rules) + "|", None)
+            elif table_format == 'simple':
+                templates = (row_format, None, "  ".join("-" * width for width in widths), None)
+            else:
+                templates = (row_format, None, None, None)
+            self._grid_template_cache[key] = templates
+        return templates
+
+    @staticmethod
+    def _numeric_kind(values: pd.Series) -> Optional[str]:
+        """
+        Classify a column the way tabulate would type its string values.
+        
+        Returns:
+            str: 'i' for integer columns, 'f' for float columns, or None for text.
+                 Nullable columns holding missing values print as '<NA>' and so count as text.
+        """
+        dtype = values.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return None
+        if pd.api.types.is_integer_dtype(dtype):
+            kind = 'i'
+        elif pd.api.types.is_float_dtype(dtype):
+            kind = 'f'
+        else:
+            return None
+        if not isinstance(dtype, np.dtype) and values.isna().any():
+            return None
+        return kind
 
-        # Truncate column headers and values to maximum width
-        for col in formatted_df.columns:
-            col_name = str(col)
-            if len(col_name) > self.max_col_width:
-                new_name = col_name[:self.max_col_width - 3] + '...'
-                formatted_df.rename(columns={col: new_name}, inplace=True)
+    @staticmethod
+    def _has_outer_whitespace(values: list) -> bool:
+        """Check whether any cell text starts or ends with whitespace, which tabulate strips."""
+        return any(value[:1].isspace() or value[-1:].isspace() for value in values)
 
-        # Truncate cell values
-        for col in formatted_df.columns:
-            formatted_df[col] = formatted_df[col].astype(str).apply(
-                lambda x: x[:self.max_col_width - 3] + '...' if len(x) > self.max_col_width else x)
+    @staticmethod
+    def _is_numeric_text(values: list) -> bool:
+        """
+        Check whether tabulate could type a column of cell text as numbers.
+        
+        Every non-empty value must parse as a number, allowing thousands separators.
+        This errs towards True, which only sends the page through tabulate.
+        
+        Args:
+            values: Cell text of one column
+            
+        Returns:
+            bool: True if the column may be numeric to tabulate
+        """
+        numeric = False
+        for value in values:
+            if not value:
+                continue
+            try:
+                float(value.replace(',', ''))
+            except ValueError:
+                return False
+            numeric = True
+        return numeric
 
-        return formatted_df
+    @staticmethod
+    def _align_decimals(values: list) -> list:
+        """Pad formatted numbers on the right so their decimal points line up, as tabulate does."""
+        decimals = []
+        for value in values:
+            point = value.rfind('.')
+            if point < 0:
+                point = value.rfind('e')
+            decimals.append(len(value) - point - 1 if point >= 0 else -1)
+        max_decimals = max(decimals)
+        return [value + ' ' * (max_decimals - count) for value, count in zip(values, decimals)]
 
-    def _get_view_data(self, start_row: int, end_row: int) -> Optional[pd.DataFrame]:
+    def _get_view_data(self, start_row: int, end_row: int, columns: Optional[list] = None) -> Optional[pd.DataFrame]:
         """
         Get data for the current view, using lazy loading if enabled.
         
         Args:
             start_row: Starting row index
             end_row: Ending row index
+            columns: Optional list of column names to return (default: all viewed columns).
+                     Under lazy loading only these columns are read from the file.
             
         Returns:
             DataFrame for the specified row range
         """
         if self.lazy_loading_enabled and self.df is None:
-            # Use lazy loading to get only the needed rows
-            chunk_key = (start_row, end_row)
+            # Slice the requested rows out of the cached row groups that overlap the range
+            try:
+                parquet_file = self._get_parquet_file()
+                offsets = self._row_group_offsets
+                end_row = min(end_row, int(offsets[-1])) if len(offsets) > 0 else 0
+                if columns is None:
+                    columns = self._get_column_names()
+                # Read the stored index columns too, so to_pandas restores the file's row labels
+                columns = list(columns) + [name for name in self._get_index_columns() if name not in columns]
 
-            # Check cache first
-            if chunk_key in self.cached_chunks:
-                return self.cached_chunks[chunk_key]
+                if start_row >= end_row:
+                    return parquet_file.schema_arrow.empty_table().select(columns).to_pandas(types_mapper=STRING_TYPES_MAPPER)
+
+                first_rg = int(np.searchsorted(offsets, start_row, side='right'))
+                last_rg = int(np.searchsorted(offsets, end_row - 1, side='right'))
+
+                tables = []
+                for rg_idx in range(first_rg, last_rg + 1):
+                    table = self._get_row_group(rg_idx, columns)
+                    rg_start = int(offsets[rg_idx - 1]) if rg_idx > 0 else 0
+                    local_start = max(start_row - rg_start, 0)
+                    local_end = min(end_row - rg_start, table.num_rows)
+                    tables.append(table.slice(local_start, local_end - local_start))
+
+                # The view table is a throwaway slice of the cached row groups, so its
+                # references can be released as the conversion proceeds
+                view_table = tables[0] if len(tables) == 1 else pa.concat_tables(tables)
+                chunk_df = view_table.to_pandas(self_destruct=True, split_blocks=True, use_threads=True,
+                                                types_mapper=STRING_TYPES_MAPPER)
+                del view_table, tables
+                if self._range_index is not None:
+                    chunk_df.index = self._range_index[start_row:end_row]
+
+                # Start decoding the neighbouring row group in the direction of travel
+                scrolling_up = self._last_view_start is not None and start_row < self._last_view_start
+                self._last_view_start = start_row
+                self._prefetch_row_group(first_rg - 1 if scrolling_up else last_rg + 1, columns)
 
-            # Load the data chunk
-            try:
-                row_range = (start_row, end_row)
-                columns = self.selected_columns if hasattr(self, 'selected_columns') else None
-                chunk_df = self.parquet_reader.read_file(
-                    self.file_path,
-                    columns=columns,
-                    row_range=row_range
-                )
-
-                # Cache the chunk (limit cache size to avoid memory issues)
-                if len(self.cached_chunks) >= 10:  # Keep only last 10 chunks
-                    # Remove oldest chunk
-                    oldest_key = next(iter(self.cached_chunks))
-                    del self.cached_chunks[oldest_key]
-
-                self.cached_chunks[chunk_key] = chunk_df
                 return chunk_df
 
             except Exception as e:
@@ -408,4 +1228,136 @@ class InteractiveViewer:
                 return None
         else:
             # Use the existing DataFrame
-            return self.df.iloc[start_row:end_row] if self.df is not None else None
+            if self.df is None:
+                return None
+            if columns is None:
+                return self.df.iloc[start_row:end_row]
+            if not self.df.columns.is_unique:
+                return self.df.iloc[start_row:end_row][columns]
+
+            # Select rows and columns in one positional lookup, resolving names to positions once per column set
+            key = tuple(columns)
+            positions = self._column_positions_cache.get(key)
+            if positions is None:
+                positions = self.df.columns.get_indexer(columns)
+                if (positions < 0).any():
+                    raise KeyError(f"Columns not found: {[name for name, pos in zip(columns, positions) if pos < 0]}")
+                self._column_positions_cache[key] = positions
+            return self.df.iloc[start_row:end_row, positions]
+
+    def _get_parquet_file(self) -> pq.ParquetFile:
+        """
+        Get the open ParquetFile handle, opening it on first use.
+        
+        Keeping a single handle avoids re-parsing the file footer on every scroll, and
+        the handle already opened by the parquet_reader for the same file is reused.
+        The file is memory-mapped, and pre-buffering coalesces the column chunk
+        reads of each row group into as few large reads as possible.
+        The handle (and the row group cache) is dropped if ``file_path`` changes.
+        
+        Returns:
+            pq.ParquetFile: Open handle for the viewer's file
+        """
+        if self._parquet_file is None or self._parquet_file_path != self.file_path:
+            self.close()
+            parquet_file = self.parquet_reader.get_parquet_file(self.file_path) if self.parquet_reader else None
+            if parquet_file is None:
+                parquet_file = pq.ParquetFile(self.file_path, memory_map=True, pre_buffer=True)
+            metadata = parquet_file.metadata
+            self._row_group_offsets = np.cumsum(
+                [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)], dtype=np.int64
+            )
+            self._parquet_file = parquet_file
+            self._parquet_file_path = self.file_path
+        return self._parquet_file
+
+    def _get_row_group(self, rg_idx: int, columns: list) -> pa.Table:
+        """
+        Get a decoded row group, reading from the file only the columns not yet cached.
+        
+        Each cached row group accumulates the columns read so far, so horizontal
+        scrolling only decodes newly revealed columns. Cached row groups are evicted
+        least-recently-used first once their total size exceeds ``cache_budget_bytes``.
+        The most recent row group is always kept.
+        
+        Args:
+            rg_idx: Row group index
+            columns: Column names to return
+            
+        Returns:
+            pa.Table: Decoded row group restricted to the requested columns
+        """
+        table = self.cached_chunks.get(rg_idx)
+        if table is None:
+            table = self._take_prefetched(rg_idx)
+            if table is not None:
+                self._cached_bytes += table.nbytes
+        if table is None:
+            table = self._parquet_file.read_row_group(rg_idx, columns=columns, use_threads=True)
+            self._cached_bytes += table.nbytes
+        else:
+            cached_names = set(table.column_names)
+            missing = [name for name in columns if name not in cached_names]
+            if missing:
+                extra = self._parquet_file.read_row_group(rg_idx, columns=missing, use_threads=True)
+                for name, column in zip(extra.column_names, extra.columns):
+                    table = table.append_column(name, column)
+                self._cached_bytes += extra.nbytes
+        self.cached_chunks[rg_idx] = table
+        self.cached_chunks.move_to_end(rg_idx)
+
+        # Evict least recently used row groups until we are back under budget
+        while self._cached_bytes > self.cache_budget_bytes and len(self.cached_chunks) > 1:
+            _, evicted = self.cached_chunks.popitem(last=False)
+            self._cached_bytes -= evicted.nbytes
+
+        return table.select(columns)
+
+    def _prefetch_row_group(self, rg_idx: int, columns: list) -> None:
+        """
+        Start decoding a row group on a background thread so a later scroll finds it ready.
+        
+        The worker uses its own ParquetFile handle (sharing the already-parsed footer
+        metadata), so it never reads through the handle used by the main thread. It
+        decodes the same columns as dictionaries as that handle does, so prefetched
+        row groups have the same schema as those read directly.
+        
+        Args:
+            rg_idx: Row group index to prefetch
+            columns: Column names to read
+        """
+        if (rg_idx < 0 or rg_idx >= len(self._row_group_offsets) or
+                rg_idx in self.cached_chunks or rg_idx in self._prefetch_futures):
+            return
+
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pqlens-prefetch')
+            read_dictionary = [field.name for field in self._parquet_file.schema_arrow if pa.types.is_dictionary(field.type)]
+            self._prefetch_file = pq.ParquetFile(self.file_path, metadata=self._parquet_file.metadata,
+                                                 read_dictionary=read_dictionary or None, memory_map=True, pre_buffer=True)
+
+        # Keep at most one outstanding prefetch; a stale one is simply discarded
+        for pending in self._prefetch_futures.values():
+            pending.cancel()
+        self._prefetch_futures = {
+            rg_idx: self._prefetch_pool.submit(self._prefetch_file.read_row_group, rg_idx, columns=columns, use_threads=True)
+        }
+
+    def _take_prefetched(self, rg_idx: int) -> Optional[pa.Table]:
+        """
+        Collect a prefetched row group, waiting for it if it is still being decoded.
+        
+        Args:
+            rg_idx: Row group index
+            
+        Returns:
+            pa.Table: Prefetched row group, or None if it was not prefetched or the read failed
+        """
+        future = self._prefetch_futures.pop(rg_idx, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # Fall back to a regular read on the main thread
+            return None
@@ -3,14 +3,58 @@ Parquet file reading and validation
 """
 
 import os
-from typing import Optional
+import time
+from pathlib import Path
+from typing import Iterator, Optional
 
+import numpy as np
 import pandas as pd
-import psutil
+import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from ..utils.validation import validate_path_parameter
 
+# Import psutil conditionally; without it memory figures are reported as unknown (-1)
+try:
+    import psutil
+
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+    psutil = None
+
+# File extensions accepted without a warning
+PARQUET_EXTENSIONS = frozenset(('.parquet', '.pqt'))
+
+# Decode Arrow strings into Arrow-backed pandas strings instead of Python object arrays
+STRING_TYPES_MAPPER = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+}.get
+
+
+def release_unused_memory() -> None:
+    """Hand memory freed by Arrow back to the operating system, where the allocator supports it."""
+    try:
+        pa.default_memory_pool().release_unused()
+    except Exception:
+        pass
+
+
+def return_freed_memory_immediately() -> None:
+    """
+    Have Arrow's jemalloc allocator return freed pages to the operating system at once.
+    
+    This changes allocator behaviour for the whole process, so it is left to the
+    command-line entry point rather than done by ParquetReader. Memory usage then
+    reflects the data actually loaded. Does nothing when jemalloc is not Arrow's allocator.
+    """
+    try:
+        pa.jemalloc_set_decay_ms(0)
+    except Exception:
+        pass
+
 
 class ParquetReader:
     """Handles reading and validating Parquet files with memory-efficient lazy loading."""
@@ -26,8 +70,23 @@ class ParquetReader:
         self.memory_threshold_mb = memory_threshold_mb
         self.enable_lazy_loading = enable_lazy_loading
         self._parquet_file = None
+        self._parquet_file_path = None
+        self._parquet_file_version = None
+        self._row_group_offsets = None
         self._file_info = None
 
+        # String columns are read as categoricals when every sampled row group stores them with a
+        # dictionary page at most this large, and at most this many bytes per value stored
+        self.categorical_max_dictionary_bytes = 64 * 1024
+        self.categorical_max_dictionary_bytes_per_value = 0.5
+        # At most this many row groups, spread over the file, are inspected for that
+        self.categorical_sample_row_groups = 8
+
+        # Available memory is re-read from the system at most once per TTL (seconds)
+        self.available_memory_ttl = 1.0
+        self._available_memory = None
+        self._process = None
+
     def read_file(self, file_path: str, columns: Optional[list] = None,
                   row_range: Optional[tuple] = None) -> Optional[pd.DataFrame]:
         """
@@ -61,26 +120,26 @@ class ParquetReader:
         # Convert to string for consistent handling
         file_path = str(path)
 
-        # File existence validation
-        if not path.exists():
+        # File existence validation and size (for memory decisions and error reporting)
+        # from a single stat call; unreadable files are reported when they are opened
+        try:
+            file_stat = path.stat()
+            file_size = file_stat.st_size
+            file_version = (file_stat.st_size, file_stat.st_mtime_ns)
+        except FileNotFoundError:
             print(f"Error: File not found - '{file_path}'")
             print("Please check the file path and try again.")
             return None
-
-        # Check file permissions
-        if not os.access(file_path, os.R_OK):
+        except PermissionError:
             print(f"Error: Permission denied - cannot read file '{file_path}'")
             print("Please check file permissions and try again.")
             return None
-
-        # Get file size for memory error reporting
-        try:
-            file_size = path.stat().st_size
         except OSError:
             file_size = 0
+            file_version = None
 
         # Check file extension (warning, not error)
-        if not file_path.lower().endswith(('.parquet', '.pqt')):
+        if path.suffix.lower() not in PARQUET_EXTENSIONS:
             print(f"Warning: File '{file_path}' does not have a .parquet extension")
             print("Attempting to read as Parquet format anyway...")
 
@@ -89,24 +148,29 @@ class ParquetReader:
 
         # Always try to get file metadata for potential lazy loading operations
         try:
-            # Get file metadata first (for file_info)
+            # Get file metadata first (for file_info); the handle is memory-mapped so
+            # later row group reads come straight from the page cache
             try:
-                parquet_file = pq.ParquetFile(file_path)
-                self._parquet_file = parquet_file
-                self._file_info = {
-                    'num_rows': parquet_file.metadata.num_rows,
-                    'num_columns': len(parquet_file.schema_arrow),
-                    'schema': parquet_file.schema_arrow
-                }
+                parquet_file = self._open_parquet_file(file_path, file_version)
             except Exception:
                 # If we can't get metadata, file_info will remain None
                 pass
+            else:
+                if row_range is None:
+                    self._warn_if_exceeds_memory(parquet_file.metadata, columns)
 
             # Attempt to read the Parquet file with specific error handling
-            if use_lazy_loading:
-                df = self._read_with_lazy_loading(file_path, columns, row_range)
+            file_info = self._file_info if self._parquet_file is not None else None
+            if file_info is not None and not self._check_columns(file_path, file_info, columns):
+                return None
+            if file_info is not None and (file_info['num_rows'] == 0 or file_info['num_columns'] == 0):
+                # Nothing to decode - build the (empty) frame from the footer alone
+                df = self._read_without_data(self._parquet_file, columns, row_range)
             else:
-                df = self._read_traditional(file_path, columns, row_range)
+                if use_lazy_loading and file_info is not None:
+                    print(f"Using memory-efficient loading for large file "
+                          f"({file_info['num_rows']:,} rows, {file_info['num_columns']} columns)")
+                df = self._read(file_path, columns, row_range)
 
             # Post-read validation
             if df is None:
@@ -118,6 +182,8 @@ class ParquetReader:
                 print(f"Warning: Parquet file '{file_path}' has no columns")
                 print("This is a valid but unusual Parquet file structure.")
 
+            # Decoding scratch space (e.g. decompressed pages) is no longer needed
+            release_unused_memory()
             return df
 
         except ImportError as e:
@@ -150,7 +216,7 @@ class ParquetReader:
             print(f"Available memory: {available_memory:.1f} MB")
             if not use_lazy_loading:
                 print("Tip: Try enabling lazy loading or reading only specific columns/rows.")
-            return None
+            return self._read_preview(file_path, columns)
 
         except ValueError as e:
             error_msg = str(e).lower()
@@ -184,6 +250,117 @@ class ParquetReader:
             print("This may indicate a bug in the software or an unusual file format.")
             return None
 
+    def _open_parquet_file(self, file_path: str, file_version: Optional[tuple]) -> pq.ParquetFile:
+        """
+        Open a Parquet file, reusing the previous handle if the file has not changed since.
+        
+        Args:
+            file_path: Path to the Parquet file
+            file_version: (size, modification time) of the file, or None if unknown
+            
+        Returns:
+            pq.ParquetFile: Open, memory-mapped handle
+        """
+        if (self._parquet_file is not None and file_version is not None
+                and self._parquet_file_path == file_path and self._parquet_file_version == file_version):
+            return self._parquet_file
+
+        self._parquet_file = None
+        self._parquet_file_path = None
+        self._parquet_file_version = None
+        self._row_group_offsets = None
+        self._file_info = None
+
+        parquet_file = pq.ParquetFile(file_path, memory_map=True, pre_buffer=True)
+        # Materialize the footer figures once; each access to them crosses into C++.
+        # The schema is the file's own, not the decode schema with dictionary columns
+        schema = parquet_file.schema_arrow
+        dictionary_columns = self._low_cardinality_columns(parquet_file.metadata, schema)
+        if dictionary_columns:
+            # Decode these columns straight into dictionary arrays, which pandas keeps as
+            # categoricals; the footer already parsed is passed on rather than read again
+            parquet_file = pq.ParquetFile(file_path, metadata=parquet_file.metadata,
+                                          read_dictionary=dictionary_columns, memory_map=True, pre_buffer=True)
+        self._parquet_file = parquet_file
+        self._parquet_file_path = file_path
+        self._parquet_file_version = file_version
+        self._file_info = {
+            'num_rows': parquet_file.metadata.num_rows,
+            'num_columns': len(schema),
+            'schema': schema
+        }
+        return parquet_file
+
+    def _low_cardinality_columns(self, metadata: pq.FileMetaData, schema: pa.Schema) -> list:
+        """
+        Find the string columns whose values come from a small dictionary in the sampled row groups.
+        
+        Parquet writers dictionary-encode columns until the dictionary grows too large, so a
+        column chunk whose dictionary page is small for its number of values holds few
+        distinct values. Only up to ``categorical_sample_row_groups`` row groups, spread
+        evenly over the file, are inspected, so opening a file with many row groups stays cheap.
+        Index columns are left out so the index keeps its type.
+        
+        Args:
+            metadata: Footer of the file
+            schema: Arrow schema of the file
+            
+        Returns:
+            list: Names of the columns to read as dictionaries
+        """
+        if metadata.num_rows == 0 or metadata.num_row_groups == 0:
+            return []
+
+        index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+        candidates = {field.name for field in schema
+                      if (pa.types.is_string(field.type) or pa.types.is_large_string(field.type))
+                      and field.name not in index_columns}
+        if not candidates:
+            return []
+
+        # Column chunk positions of the candidates, resolved once from the first row group
+        first_row_group = metadata.row_group(0)
+        positions = {}
+        for col_idx in range(first_row_group.num_columns):
+            name = first_row_group.column(col_idx).path_in_schema
+            if name in candidates:
+                positions[name] = col_idx
+
+        num_row_groups = metadata.num_row_groups
+        sample_size = min(num_row_groups, self.categorical_sample_row_groups)
+        sampled = sorted({round(i * (num_row_groups - 1) / max(sample_size - 1, 1)) for i in range(sample_size)})
+        for rg_idx in sampled:
+            if not positions:
+                break
+            row_group = metadata.row_group(rg_idx)
+            for name, col_idx in list(positions.items()):
+                column = row_group.column(col_idx)
+                if not column.has_dictionary_page or not column.dictionary_page_offset:
+                    del positions[name]
+                    continue
+                dictionary_bytes = column.data_page_offset - column.dictionary_page_offset
+                if (dictionary_bytes > self.categorical_max_dictionary_bytes
+                        or dictionary_bytes > column.num_values * self.categorical_max_dictionary_bytes_per_value):
+                    del positions[name]
+        return [field.name for field in schema if field.name in positions]
+
+    def _get_row_group_offsets(self) -> np.ndarray:
+        """
+        Get the cumulative row counts of the open file's row groups, computing them once per file.
+        
+        Entry i is the number of rows in row groups 0..i, so the row group holding a row
+        is found with a binary search.
+        
+        Returns:
+            np.ndarray: Cumulative row counts, one per row group
+        """
+        if self._row_group_offsets is None:
+            metadata = self._parquet_file.metadata
+            self._row_group_offsets = np.cumsum(
+                [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)], dtype=np.int64
+            )
+        return self._row_group_offsets
+
     def validate_path(self, file_path: str) -> bool:
         """
         Validate that a file path exists and is readable.
@@ -228,97 +405,366 @@ class ParquetReader:
 
         return False
 
-    def _read_traditional(self, file_path: str, columns: Optional[list] = None,
-                          row_range: Optional[tuple] = None) -> Optional[pd.DataFrame]:
+    def _warn_if_exceeds_memory(self, metadata, columns: Optional[list] = None) -> None:
         """
-        Traditional pandas read_parquet method.
-        
+        Warn up front when the decoded file is unlikely to fit in available memory.
+
+        Uses the uncompressed sizes recorded in the footer, so nothing is decoded.
+
         Args:
-            file_path: Path to the Parquet file
+            metadata: pyarrow FileMetaData of the file about to be read
+            columns: Optional list of columns that will be read
+        """
+        available_memory_mb = self.get_available_memory_mb()
+        if available_memory_mb <= 0:
+            return
+
+        wanted = set(columns) if columns else None
+        total_bytes = 0
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            if wanted is None:
+                total_bytes += row_group.total_byte_size
+                continue
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if column.path_in_schema.split('.')[0] in wanted:
+                    total_bytes += column.total_uncompressed_size
+
+        estimated_mb = total_bytes / (1024 * 1024)
+        if estimated_mb > available_memory_mb:
+            print(f"Warning: File data is about {estimated_mb:.1f} MB uncompressed, "
+                  f"more than the {available_memory_mb:.1f} MB of available memory")
+            print("Tip: Try reading only specific columns/rows.")
+
+    def _read_without_data(self, parquet_file: pq.ParquetFile, columns: Optional[list] = None,
+                           row_range: Optional[tuple] = None) -> pd.DataFrame:
+        """
+        Build the DataFrame for a file with no rows or no columns.
+
+        Such files have no data pages, so the result comes from the footer and schema only.
+
+        Args:
+            parquet_file: Open ParquetFile with zero rows or zero columns
             columns: Optional list of columns to read
             row_range: Optional tuple (start_row, end_row) for partial reading
-            
+
         Returns:
-            DataFrame or None if error
+            DataFrame with the file's columns and dtypes
         """
         read_kwargs = {}
         if columns:
             read_kwargs['columns'] = columns
 
-        df = pd.read_parquet(file_path, **read_kwargs)
+        table = parquet_file.read(use_pandas_metadata=True, **read_kwargs)
+        df = table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=STRING_TYPES_MAPPER)
 
-        if row_range and df is not None:
+        if row_range:
             start_row, end_row = row_range
             df = df.iloc[start_row:end_row]
 
         return df
 
-    def _read_with_lazy_loading(self, file_path: str, columns: Optional[list] = None,
-                                row_range: Optional[tuple] = None) -> Optional[pd.DataFrame]:
+    def _read_preview(self, file_path: str, columns: Optional[list] = None,
+                      batch_size: int = 100_000) -> Optional[pd.DataFrame]:
         """
-        Memory-efficient reading using pyarrow with lazy loading.
-        
+        Read only the first batch of rows, as a fallback when the full read runs out of memory.
+
+        Batches are decoded one row group at a time, so only the start of the file is read.
+
+        Args:
+            file_path: Path to the Parquet file
+            columns: Optional list of columns to read
+            batch_size: Maximum number of rows to load
+
+        Returns:
+            DataFrame with at most batch_size rows, or None if even that does not fit
+        """
+        try:
+            parquet_file = pq.ParquetFile(file_path, memory_map=True, pre_buffer=True)
+            batch = next(parquet_file.iter_batches(batch_size=batch_size, columns=columns), None)
+            if batch is None:
+                table = parquet_file.schema_arrow.empty_table()
+                if columns:
+                    table = table.select(columns)
+            else:
+                table = pa.Table.from_batches([batch])
+            df = table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=STRING_TYPES_MAPPER)
+        except Exception:
+            # Includes MemoryError: nothing more can be loaded
+            return None
+
+        print(f"Warning: Loaded only the first {len(df):,} of {parquet_file.metadata.num_rows:,} rows")
+        return df
+
+    def _read(self, file_path: str, columns: Optional[list] = None,
+              row_range: Optional[tuple] = None) -> Optional[pd.DataFrame]:
+        """
+        Read the file through pyarrow, decoding only the requested columns and row groups.
+
+        Column projection skips unwanted column chunks entirely, and a row range reads
+        only the row groups that overlap it. Paths that cannot be opened as a single
+        Parquet file (e.g. dataset directories) are read as a dataset instead.
+
         Args:
             file_path: Path to the Parquet file
             columns: Optional list of columns to read
             row_range: Optional tuple (start_row, end_row) for partial reading
-            
+
         Returns:
             DataFrame or None if error
         """
-        # Use the already-loaded parquet file metadata
+        read_kwargs = {'use_threads': True, 'use_pandas_metadata': True}
+        if columns:
+            read_kwargs['columns'] = columns
+
         parquet_file = self._parquet_file
         if parquet_file is None:
-            # Fallback if metadata wasn't loaded earlier
-            parquet_file = pq.ParquetFile(file_path)
-            self._parquet_file = parquet_file
+            if row_range:
+                return self._read_dataset_rows(file_path, columns, row_range)
+            table = pq.read_table(file_path, memory_map=True, **read_kwargs)
+            return table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=STRING_TYPES_MAPPER)
+
+        if not row_range:
+            # Arrow buffers are released column by column as pandas takes them over,
+            # so both copies never coexist
+            table = parquet_file.read(**read_kwargs)
+            return table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=STRING_TYPES_MAPPER)
+
+        # Read only the row groups overlapping the range, then trim to the exact rows
+        # (positions are normalised the way iloc would, e.g. negative or open-ended bounds)
+        rows = range(self._file_info['num_rows'])[slice(*row_range)]
+        start_row, end_row = rows.start, max(rows.start, rows.stop)
+        offsets = self._get_row_group_offsets()
+
+        if start_row == 0 and end_row > 0:
+            # The head of the file: decode batch by batch and stop once enough rows are in,
+            # rather than decoding the whole first row group
+            batches = []
+            batch_rows = 0
+            for batch in parquet_file.iter_batches(batch_size=min(end_row, 65_536), **read_kwargs):
+                batches.append(batch)
+                batch_rows += batch.num_rows
+                if batch_rows >= end_row:
+                    break
+            table = pa.Table.from_batches(batches).slice(0, end_row)
+        elif start_row < end_row:
+            first_rg = int(np.searchsorted(offsets, start_row, side='right'))
+            last_rg = int(np.searchsorted(offsets, end_row - 1, side='right'))
+            table = parquet_file.read_row_groups(range(first_rg, last_rg + 1), **read_kwargs)
+            rg_start = int(offsets[first_rg - 1]) if first_rg > 0 else 0
+            table = table.slice(start_row - rg_start, end_row - start_row)
+        else:
+            table = parquet_file.read_row_groups([], **read_kwargs)
+        return self._to_pandas_rows(table, self._file_info, start_row, end_row)
 
-        # Print memory-efficient loading message
-        print(f"Using memory-efficient loading for large file ({parquet_file.metadata.num_rows:,} rows, {len(parquet_file.schema_arrow)} columns)")
+    def _read_dataset_rows(self, file_path: str, columns: Optional[list], row_range: tuple) -> pd.DataFrame:
+        """
+        Read a row range from a path that is not a single Parquet file (e.g. a dataset directory).
+
+        The row count comes from the file footers, and the scan stops once the end of the
+        range is reached, so rows after the range are never decoded.
+
+        Args:
+            file_path: Path to the dataset
+            columns: Optional list of columns to read
+            row_range: Tuple (start_row, end_row) for partial reading
+
+        Returns:
+            DataFrame holding the requested rows
+        """
+        dataset = ds.dataset(file_path, format='parquet', partitioning='hive')
+        file_info = {'num_rows': dataset.count_rows(), 'num_columns': len(dataset.schema), 'schema': dataset.schema}
+        # Kept for get_file_info, so callers showing only these rows still know the dataset's size
+        self._file_info = file_info
 
-        # Build read arguments
-        read_kwargs = {}
         if columns:
-            read_kwargs['columns'] = columns
+            # Keep the stored index columns, as pq.read_table does with use_pandas_metadata
+            index_columns = (dataset.schema.pandas_metadata or {}).get('index_columns', [])
+            columns = list(columns) + [name for name in index_columns
+                                       if isinstance(name, str) and name not in columns]
 
-        # For row range, use pyarrow's ability to read specific row groups more efficiently
-        if row_range:
-            start_row, end_row = row_range
-            # Calculate which row groups we need
-            total_rows = 0
-            start_row_group = 0
-            end_row_group = parquet_file.num_row_groups
-
-            for i in range(parquet_file.num_row_groups):
-                row_group_size = parquet_file.metadata.row_group(i).num_rows
-                if total_rows + row_group_size > start_row and start_row_group == 0:
-                    start_row_group = i
-                if total_rows + row_group_size >= end_row:
-                    end_row_group = i + 1
-                    break
-                total_rows += row_group_size
+        rows = range(file_info['num_rows'])[slice(*row_range)]
+        start_row, end_row = rows.start, max(rows.start, rows.stop)
+        table = dataset.head(end_row, columns=columns).slice(start_row)
+        return self._to_pandas_rows(table, file_info, start_row, end_row)
 
-            # Read only the necessary row groups
-            table = parquet_file.read_row_groups(
-                list(range(start_row_group, end_row_group)),
-                **read_kwargs
-            )
-            df = table.to_pandas()
+    def _to_pandas_rows(self, table: pa.Table, file_info: dict, start_row: int, end_row: int) -> pd.DataFrame:
+        """
+        Convert rows start_row..end_row of a file, already sliced out in Arrow, to a DataFrame.
 
-            # Fine-tune the row selection within the loaded row groups
-            actual_start = start_row - sum(
-                parquet_file.metadata.row_group(i).num_rows
-                for i in range(start_row_group)
-            )
-            actual_end = actual_start + (end_row - start_row)
-            df = df.iloc[actual_start:actual_end]
-        else:
-            # Read the entire file but potentially with column selection
-            table = parquet_file.read(**read_kwargs)
-            df = table.to_pandas()
+        Args:
+            table: The requested rows of the file
+            file_info: Row count and Arrow schema of the whole file
+            start_row: Position of the table's first row in the file
+            end_row: Position just past the table's last row in the file
+
+        Returns:
+            DataFrame indexed as the same rows of a full read would be
+        """
+        df = table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=STRING_TYPES_MAPPER)
 
+        # A range index kept only in the pandas metadata restarts at 0 for partial reads
+        file_index = self._file_range_index(file_info)
+        if file_index is not None and isinstance(df.index, pd.RangeIndex):
+            df.index = file_index[start_row:end_row]
         return df
 
+    @staticmethod
+    def _file_range_index(file_info: dict) -> Optional[pd.RangeIndex]:
+        """
+        Get the index a full read of the file would produce, when it is a range index.
+
+        Args:
+            file_info: File information of the open file (row count and Arrow schema)
+
+        Returns:
+            RangeIndex covering every row, or None if the index is stored as data columns
+        """
+        num_rows = file_info['num_rows']
+        index_columns = (file_info['schema'].pandas_metadata or {}).get('index_columns', [])
+        if not index_columns:
+            return pd.RangeIndex(num_rows)
+        if len(index_columns) == 1 and isinstance(index_columns[0], dict) and index_columns[0].get('kind') == 'range':
+            index = index_columns[0]
+            return pd.RangeIndex(index['start'], index['start'] + num_rows * index['step'], index['step'])
+        return None
+
+    def read_head(self, file_path: str, n_rows: int, columns: Optional[list] = None) -> Optional[pd.DataFrame]:
+        """
+        Read only the first rows of a Parquet file.
+        
+        Decoding stops as soon as n_rows rows have been read, so the rest of the file
+        (including the rest of the first row group) is never decoded. Validation and
+        error reporting are the same as for read_file.
+        
+        Args:
+            file_path: Path to the Parquet file
+            n_rows: Number of rows to read
+            columns: Optional list of columns to read
+            
+        Returns:
+            DataFrame with at most n_rows rows, or None if error
+        """
+        return self.read_file(file_path, columns=columns, row_range=(0, max(n_rows, 0)))
+
+    @staticmethod
+    def _check_columns(file_path: str, file_info: dict, columns: Optional[list]) -> bool:
+        """
+        Check that every requested column exists, reporting any that do not.
+
+        ParquetFile reads silently skip unknown column names, so they are checked
+        against the schema before reading.
+
+        Args:
+            file_path: Path to the Parquet file
+            file_info: File information of the open file
+            columns: Optional list of columns to read
+
+        Returns:
+            bool: True if all columns exist (or none were requested), False otherwise
+        """
+        if not columns:
+            return True
+        available = set(file_info['schema'].names)
+        missing = [name for name in columns if name not in available]
+        if missing:
+            print(f"Error: Column(s) not found in Parquet file '{file_path}': {', '.join(map(str, missing))}")
+            return False
+        return True
+
+    def open_metadata_only(self, file_path: str, columns: Optional[list] = None) -> Optional[dict]:
+        """
+        Open a Parquet file and parse its footer without reading any data.
+
+        The handle and file info are kept as for read_file, so a viewer that pages
+        through the file lazily can reuse them through get_parquet_file.
+
+        Args:
+            file_path: Path to the Parquet file
+            columns: Optional list of columns that will be read, checked against the schema
+
+        Returns:
+            dict: File information (see get_file_info), or None if error
+        """
+        try:
+            path = validate_path_parameter(file_path)
+            if path is None:
+                print("Error: Empty file path provided")
+                return None
+        except ValueError as e:
+            print(f"Error: {e}")
+            return None
+
+        file_path = str(path)
+        try:
+            file_stat = path.stat()
+            self._open_parquet_file(file_path, (file_stat.st_size, file_stat.st_mtime_ns))
+        except FileNotFoundError:
+            print(f"Error: File not found - '{file_path}'")
+            print("Please check the file path and try again.")
+            return None
+        except PermissionError:
+            print(f"Error: Permission denied - cannot read file '{file_path}'")
+            print("Please check file permissions and try again.")
+            return None
+        except (OSError, pa.ArrowException) as e:
+            print(f"Error: Could not read Parquet metadata from '{file_path}'")
+            print(f"Details: {e}")
+            return None
+        if not self._check_columns(file_path, self._file_info, columns):
+            return None
+        return self._file_info
+
+    def iter_batches(self, file_path: str, columns: Optional[list] = None,
+                     batch_size: int = 64_000) -> Iterator[pd.DataFrame]:
+        """
+        Stream a Parquet file as a sequence of DataFrames instead of loading it whole.
+
+        Only one batch is decoded at a time, so files larger than memory can be processed.
+        Batches are converted the way read_file converts the file, so concatenating them
+        gives the same DataFrame: a stored index is restored and a range index continues
+        from one batch to the next. Errors are reported as for open_metadata_only, and
+        then nothing is yielded.
+
+        Args:
+            file_path: Path to the Parquet file
+            columns: Optional list of columns to read
+            batch_size: Maximum number of rows per DataFrame
+
+        Returns:
+            Iterator[pd.DataFrame]: DataFrames of at most batch_size rows, in file order
+        """
+        file_info = self.open_metadata_only(file_path, columns=columns)
+        if file_info is None:
+            return
+
+        parquet_file = self._parquet_file
+        start_row = 0
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns or None,
+                                               use_threads=True, use_pandas_metadata=True):
+            table = pa.Table.from_batches([batch])
+            del batch
+            end_row = start_row + table.num_rows
+            yield self._to_pandas_rows(table, file_info, start_row, end_row)
+            start_row = end_row
+
+    def get_parquet_file(self, file_path: str) -> Optional[pq.ParquetFile]:
+        """
+        Get the ParquetFile opened by the last read_file call, if it was for the given path.
+        
+        Lets other components reuse the already-parsed footer instead of parsing it again.
+        
+        Args:
+            file_path: Path of the file the caller wants to read
+            
+        Returns:
+            pq.ParquetFile: The open handle, or None if the last read was for another path
+        """
+        if self._parquet_file is None or str(Path(file_path)) != self._parquet_file_path:
+            return None
+        return self._parquet_file
+
     def get_file_info(self) -> Optional[dict]:
         """
         Get metadata about the currently loaded file (if using lazy loading).
@@ -332,9 +778,32 @@ class ParquetReader:
         """
         Get available system memory in MB.
         
+        The figure is cached for ``available_memory_ttl`` seconds, since reading it
+        means parsing /proc/meminfo (or the platform equivalent).
+        
+        Returns:
+            float: Available memory in MB, or -1 if unable to determine
+        """
+        now = time.monotonic()
+        if self._available_memory is not None and now - self._available_memory[0] < self.available_memory_ttl:
+            return self._available_memory[1]
+
+        available_mb = self._probe_available_memory_mb()
+        if available_mb < 0:
+            return -1
+        self._available_memory = (now, available_mb)
+        return available_mb
+
+    @staticmethod
+    def _probe_available_memory_mb() -> float:
+        """
+        Read available system memory from the operating system, bypassing the cache.
+        
         Returns:
             float: Available memory in MB, or -1 if unable to determine
         """
+        if not HAS_PSUTIL:
+            return -1
         try:
             memory = psutil.virtual_memory()
             return memory.available / (1024 * 1024)
@@ -348,9 +817,12 @@ class ParquetReader:
         Returns:
             float: Memory usage in MB, or -1 if unable to determine
         """
+        if not HAS_PSUTIL:
+            return -1
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
+            if self._process is None or self._process.pid != os.getpid():
+                self._process = psutil.Process()
+            memory_info = self._process.memory_info()
             return memory_info.rss / (1024 * 1024)
         except Exception:
             return -1
@@ -3,6 +3,7 @@ Abstract base formatter interface
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import pandas as pd
 
@@ -11,12 +12,13 @@ class Formatter(ABC):
     """Abstract base class for table formatters."""
 
     @abstractmethod
-    def format_table(self, df: pd.DataFrame, **kwargs) -> str:
+    def format_table(self, df: pd.DataFrame, max_rows: Optional[int] = None, **kwargs) -> str:
         """
         Format a DataFrame as a string table.
         
         Args:
             df: DataFrame to format
+            max_rows: Format only the first max_rows rows (all rows if None)
             **kwargs: Formatter-specific options
             
         Returns:
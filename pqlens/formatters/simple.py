@@ -2,6 +2,8 @@
 Simple fallback formatter
 """
 
+from typing import Optional
+
 import pandas as pd
 
 from .formatter import Formatter
@@ -10,15 +12,19 @@ from .formatter import Formatter
 class SimpleFormatter(Formatter):
     """Simple fallback formatter that doesn't require external dependencies."""
 
-    def format_table(self, df: pd.DataFrame, **kwargs) -> str:
+    def format_table(self, df: pd.DataFrame, max_rows: Optional[int] = None, **kwargs) -> str:
         """
         Format a DataFrame using basic string representation.
         
         Args:
             df: DataFrame to format
+            max_rows: Format only the first max_rows rows (all rows if None)
             **kwargs: Ignored for simple formatter
             
         Returns:
             str: Formatted table as string
         """
-        return str(df)
+        if max_rows is None:
+            return str(df)
+        # Slice first so only the rows shown are ever converted to text
+        return df.head(max_rows).to_string()
@@ -2,22 +2,31 @@
 Tabulate-based table formatter
 """
 
+from importlib.util import find_spec
+from typing import Optional
+
 import pandas as pd
 
 from .formatter import Formatter
 
-# Import tabulate conditionally to avoid issues if not installed
-try:
-    from tabulate import tabulate
-
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+# tabulate is imported on first use rather than here: the interactive grid view renders
+# without it, so sessions that never need it skip the import
+TABULATE_AVAILABLE = find_spec("tabulate") is not None
+_tabulate_module = None
 
 
-    def tabulate(data_rows, headers=None, tablefmt='grid', showindex=False):
-        # Fallback for when tabulate is not available
-        return "tabulate not installed. Install with: pip install tabulate"
+def _get_tabulate():
+    """
+    Import the tabulate module on first use.
+    
+    Returns:
+        module: The tabulate module
+    """
+    global _tabulate_module
+    if _tabulate_module is None:
+        import tabulate
+        _tabulate_module = tabulate
+    return _tabulate_module
 
 
 class TabulateFormatter(Formatter):
@@ -27,7 +36,8 @@ class TabulateFormatter(Formatter):
         """Initialize the formatter."""
         self.available = TABULATE_AVAILABLE
 
-    def format_table(self, df: pd.DataFrame, style: str = 'grid', showindex: bool = False, **kwargs) -> str:
+    def format_table(self, df: pd.DataFrame, style: str = 'grid', showindex: bool = False,
+                     max_rows: Optional[int] = None, **kwargs) -> str:
         """
         Format a DataFrame using tabulate.
         
@@ -35,6 +45,7 @@ class TabulateFormatter(Formatter):
             df: DataFrame to format
             style: Table format style ('grid', 'fancy_grid', etc.)
             showindex: Whether to show row indices
+            max_rows: Format only the first max_rows rows (all rows if None)
             **kwargs: Additional tabulate options
             
         Returns:
@@ -43,7 +54,11 @@ class TabulateFormatter(Formatter):
         if not self.available:
             return "tabulate not installed. Install with: pip install tabulate"
 
+        if max_rows is not None:
+            df = df.head(max_rows)
+
+        tabulate_module = _get_tabulate()
         try:
-            return tabulate(df, headers=df.columns, tablefmt=style, showindex=showindex, **kwargs)
+            return tabulate_module.tabulate(df, headers=df.columns, tablefmt=style, showindex=showindex, **kwargs)
         except Exception as e:
             return f"Error formatting table: {e}\nFalling back to basic display:\n{df}"
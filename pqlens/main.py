@@ -31,45 +31,48 @@ Usage:
    $ python ./pqlens/parquet_viewer.py --table-format fancy_grid /path/to/file.parquet
 """
 
+import argparse
 import sys
-
-from .core.display import DataFrameDisplay
-from .core.interactive import InteractiveViewer
-from .core.reader import ParquetReader
+from importlib.util import find_spec
 
 
 # Check for required dependencies
 def check_package(package_name):
-    try:
-        __import__(package_name)
+    # find_spec only locates the package on sys.path; it does not import it
+    if find_spec(package_name) is not None:
         return True
-    except ImportError:
-        print(f"ERROR: Missing required package '{package_name}'")
-        print(f"Please install it using: pip install {package_name}")
-        print(f"If using a system Python, you may need: python -m pip install --user {package_name}")
-        print(f"Or use a virtual environment: python -m venv .venv && source .venv/Scripts/activate && pip install {package_name}")
-        return False
+    print(f"ERROR: Missing required package '{package_name}'")
+    print(f"Please install it using: pip install {package_name}")
+    print(f"If using a system Python, you may need: python -m pip install --user {package_name}")
+    print(f"Or use a virtual environment: python -m venv .venv && source .venv/Scripts/activate && pip install {package_name}")
+    return False
 
 
 # Check for required packages
 required_packages = ["pandas", "pyarrow"]
 optional_packages = ["tabulate", "readchar"]
 
-# Check required packages first
+# Check required packages first, before the modules below import them
 missing_required = [pkg for pkg in required_packages if not check_package(pkg)]
 if missing_required:
     print(f"ERROR: Missing required packages: {', '.join(missing_required)}")
     sys.exit(1)
 
 # Check psutil for memory monitoring
-try:
-    import psutil
-except ImportError:
+if find_spec("psutil") is None:
     print("WARNING: psutil not available - memory monitoring disabled")
     print("Install with: pip install psutil")
 
 # Check optional packages
-[check_package(pkg) for pkg in optional_packages]
+for pkg in optional_packages:
+    check_package(pkg)
+
+import pandas as pd
+
+from .core.display import DataFrameDisplay
+from .core.interactive import InteractiveViewer
+from .core.reader import ParquetReader, return_freed_memory_immediately
+from .utils.validation import validate_rows_parameter
 
 
 def view_parquet_file(file_path, columns=None, row_range=None, enable_lazy_loading=True):
@@ -89,7 +92,7 @@ def view_parquet_file(file_path, columns=None, row_range=None, enable_lazy_loadi
     return reader.read_file(file_path, columns=columns, row_range=row_range)
 
 
-def display_table(df, rows=10):
+def display_table(df, rows=10, file_path=None):
     """
     Display a DataFrame as a nicely formatted table.
     
@@ -97,30 +100,32 @@ def display_table(df, rows=10):
 
     :param df: DataFrame to display
     :param rows: Number of rows to display
+    :param file_path: Optional Parquet file to read only the first rows from when df is None
     """
     display = DataFrameDisplay()
-    display.show_table(df, rows)
+    display.show_table(df, rows, file_path=file_path)
 
 
-def paged_display(df, page_size=10, table_format='grid'):
+def paged_display(df, page_size=10, table_format='grid', reader=None, file_path=None, columns=None):
     """
     Display DataFrame in pages with arrow key navigation.
     
     Handles edge cases like zero columns, invalid parameters, and provides
     helpful feedback for unusual data structures.
 
-    :param df: DataFrame to display
+    :param df: DataFrame to display, or None to page through file_path lazily
     :param page_size: Number of rows to show per page
     :param table_format: Table format style ('grid', 'fancy_grid', etc.)
+    :param reader: ParquetReader that has opened file_path, for lazy loading
+    :param file_path: Parquet file to read pages from when df is None
+    :param columns: Optional list of columns to display
     """
-    viewer = InteractiveViewer(df)
-    viewer.start_interactive_mode(page_size, table_format)
+    viewer = InteractiveViewer(df, parquet_reader=reader, file_path=file_path)
+    viewer.start_interactive_mode(page_size, table_format, columns=columns)
 
 
 def main():
     """Main function for command-line usage."""
-    import argparse
-
     parser = argparse.ArgumentParser(description='View Parquet file content')
     parser.add_argument('file_path', nargs='?', default='.samples/weather.parquet', help='Path to the parquet file')
     parser.add_argument('-n', '--rows', type=int, default=10, help='Number of rows to display')
@@ -133,6 +138,9 @@ def main():
     args = parser.parse_args()
 
     enable_lazy = not args.no_lazy_loading
+
+    # The CLI owns the process, so its allocator can be tuned for the memory usage readout
+    return_freed_memory_immediately()
     
     # Initialize reader with memory optimization settings
     reader = ParquetReader(
@@ -141,25 +149,36 @@ def main():
     )
     
     if args.interactive and enable_lazy:
-        # For interactive mode with lazy loading, don't load the full dataset upfront
-        reader.read_file(args.file_path)  # Load metadata only
-        if args.interactive:
+        # For interactive mode with lazy loading, parse only the footer; the viewer
+        # reuses the reader's open handle and reads row groups as pages are shown
+        if reader.open_metadata_only(args.file_path, columns=args.columns) is not None:
             paged_display(
-                df=None, 
-                page_size=args.rows, 
+                df=None,
+                page_size=args.rows,
                 table_format=args.table_format,
+                reader=reader,
                 file_path=args.file_path,
-                columns=args.columns,
-                enable_lazy_loading=enable_lazy
+                columns=args.columns
             )
-            return
-    
-    # Load the data (potentially with lazy loading)
-    result_df = reader.read_file(args.file_path, columns=args.columns)
+        return
+
+    # Load the data (potentially with lazy loading); a static table only needs its first rows
+    shape = None
+    if args.interactive:
+        result_df = reader.read_file(args.file_path, columns=args.columns)
+    else:
+        try:
+            rows = validate_rows_parameter(args.rows)
+        except ValueError as e:
+            print(f"Warning: {e}, using default of 10")
+            rows = 10
+        result_df = reader.read_head(args.file_path, rows, columns=args.columns)
+        file_info = reader.get_file_info()
+        if result_df is not None and file_info is not None:
+            shape = (file_info['num_rows'], len(result_df.columns))
 
     if result_df is not None:
         # Set pandas display options
-        import pandas as pd
         pd.set_option('display.max_columns', None)
         pd.set_option('display.width', None)
 
@@ -169,7 +188,7 @@ def main():
         else:
             # Print summary info and display table
             display = DataFrameDisplay()
-            display.show_table(result_df, args.rows)
+            display.show_table(result_df, rows, shape=shape)
             
             # Show memory usage if reader is available
             if hasattr(reader, 'get_memory_usage_mb'):
@@ -2,14 +2,33 @@
 Terminal handling utilities for pqlens
 """
 
+import os
+import re
+import select
 import shutil
+import signal
 import sys
-from typing import Tuple
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+# One keystroke: a CSI sequence (arrows, page keys), an SS3 sequence, an Alt+key pair, or a single character
+_KEY_PATTERN = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1bO.|\x1b.?|.", re.DOTALL)
+# Input ending part way through an escape sequence
+_INCOMPLETE_ESCAPE = re.compile(rb"\x1b(?:\[[0-?]*[ -/]*|O)?$")
 
 
 class TerminalHelper:
     """Helper class for terminal operations and detection."""
 
+    # ANSI escape sequences
+    CLEAR_SCREEN = "\033[H\033[J"
+    CLEAR_LINE = "\033[2K"
+    CLEAR_TO_END = "\033[J"
+    # Synchronized output: supporting terminals hold rendering until the end marker; others ignore both
+    BEGIN_SYNC = "\033[?2026h"
+    END_SYNC = "\033[?2026l"
+
     @staticmethod
     def get_size() -> Tuple[int, int]:
         """
@@ -23,7 +42,144 @@ class TerminalHelper:
     @staticmethod
     def clear_screen() -> None:
         """Clear the terminal screen using ANSI escape codes."""
-        print("\033[H\033[J", end="")
+        print(TerminalHelper.CLEAR_SCREEN, end="")
+
+    @staticmethod
+    def move_to_line(line: int) -> str:
+        """
+        Build the ANSI sequence that moves the cursor to the start of a screen line.
+        
+        Args:
+            line: 1-based screen line number
+            
+        Returns:
+            str: ANSI cursor positioning sequence
+        """
+        return f"\033[{line};1H"
+
+    @staticmethod
+    def write(text: str) -> None:
+        """
+        Write text to stdout as a single encoded buffer and flush it.
+        
+        When stdout has a binary buffer the text is encoded once and handed to it in one
+        write, bypassing the text layer; characters the terminal encoding cannot represent
+        are replaced instead of raising. Streams without a buffer (e.g. StringIO) are
+        written to directly.
+        
+        Args:
+            text: Text (including any ANSI sequences) to write
+        """
+        stream = sys.stdout
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is None:
+            stream.write(text)
+            stream.flush()
+            return
+
+        # Flush pending print() output first so it is not reordered after the frame
+        stream.flush()
+        buffer.write(text.encode(stream.encoding or 'utf-8', 'replace'))
+        buffer.flush()
+
+    @staticmethod
+    def input_pending() -> bool:
+        """
+        Check, without blocking, whether keyboard input is waiting to be read.
+        
+        Returns:
+            bool: True if a key can be read immediately; False if not, or if stdin cannot be polled
+        """
+        if os.name == 'nt':
+            import msvcrt
+            return msvcrt.kbhit()
+        try:
+            return bool(select.select([sys.stdin], [], [], 0)[0])
+        except (OSError, ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def read_keys() -> Optional[list]:
+        """
+        Block until a key is typed, then return it together with every key already queued behind it.
+        
+        Reads the terminal directly so that a burst of keystrokes (e.g. a held arrow key) arrives
+        as one list. Must be used inside cbreak_input, otherwise the read waits for Enter.
+        
+        Returns:
+            list: Keys in the order typed, with escape sequences kept whole; None when stdin
+                  is not a POSIX terminal
+        """
+        if os.name == 'nt':
+            return None
+        try:
+            fd = sys.stdin.fileno()
+            if not os.isatty(fd):
+                return None
+        except (OSError, ValueError):
+            return None
+
+        data = os.read(fd, 1024)
+        # Give the rest of a split escape sequence a moment to arrive
+        while _INCOMPLETE_ESCAPE.search(data) and select.select([fd], [], [], 0.05)[0]:
+            data += os.read(fd, 1024)
+        return _KEY_PATTERN.findall(data.decode('utf-8', 'replace'))
+
+    @staticmethod
+    @contextmanager
+    def cbreak_input() -> Iterator[None]:
+        """
+        Keep a POSIX terminal in cbreak mode for the duration of the block.
+        
+        Keys typed between reads are then delivered immediately (so input_pending sees them)
+        and are not echoed over the display. Does nothing when stdin is not a terminal or
+        the platform has no termios.
+        """
+        try:
+            import termios
+            import tty
+        except ImportError:
+            yield
+            return
+
+        try:
+            fd = sys.stdin.fileno()
+            if not os.isatty(fd):
+                raise OSError("stdin is not a terminal")
+            old_settings = termios.tcgetattr(fd)
+        except (OSError, ValueError, termios.error):
+            yield
+            return
+
+        try:
+            tty.setcbreak(fd)
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+    @staticmethod
+    @contextmanager
+    def watch_resize(callback: Callable[[], None]) -> Iterator[bool]:
+        """
+        Call a function whenever the terminal is resized, for the duration of the block.
+        
+        Installs a SIGWINCH handler and restores the previous one on exit. Yields False
+        (and installs nothing) where resize signals are unavailable: on platforms without
+        SIGWINCH, or when not running in the main thread.
+        
+        Args:
+            callback: Function called with no arguments after each resize
+        """
+        sigwinch = getattr(signal, 'SIGWINCH', None)
+        if sigwinch is None or threading.current_thread() is not threading.main_thread():
+            yield False
+            return
+
+        previous_handler = signal.signal(sigwinch, lambda signum, frame: callback())
+        try:
+            yield True
+        finally:
+            signal.signal(sigwinch, previous_handler)
 
     @staticmethod
     def supports_unicode() -> bool:
@@ -4,10 +4,12 @@ Integration tests for pqlens CLI functionality
 """
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 import click
+import pandas as pd
 from click.testing import CliRunner
 
 
@@ -314,6 +316,19 @@ class TestCLI(unittest.TestCase):
         # At minimum, it should not crash the program completely
         self.assertIsInstance(returncode, int)
 
+    def test_dataset_directory_shape(self):
+        """Test that a directory dataset reports its full row count while showing only the first rows."""
+        with tempfile.TemporaryDirectory() as dataset_dir:
+            for i in range(5):
+                pd.DataFrame({'id': range(i * 500, (i + 1) * 500), 'a': 1, 'b': 2.0, 'c': 'x'}).to_parquet(
+                    Path(dataset_dir) / f"part_{i}.parquet", index=False)
+
+            returncode, stdout, stderr = self.run_cli_command(["-n", "3", dataset_dir])
+
+        self.assertEqual(returncode, 0)
+        self.assertIn("Parquet file shape: (2500, 4)", stdout)
+        self.assertIn("First 3 rows:", stdout)
+
     def test_memory_threshold_validation(self):
         """Test memory threshold parameter validation."""
         try:
@@ -93,6 +93,22 @@ class TestErrorScenarios(unittest.TestCase):
         # The exact behavior depends on pyarrow's error handling
         self.assertTrue(df is None or isinstance(df, pd.DataFrame), "Invalid column selection should be handled gracefully")
 
+    def test_missing_columns_are_reported(self):
+        """Test that unknown column names are reported instead of silently skipped."""
+        reader = ParquetReader(enable_lazy_loading=False)
+
+        for read in (lambda: reader.read_file(str(self.valid_file), columns=['id', 'nope']),
+                     lambda: reader.read_head(str(self.valid_file), 3, columns=['nope']),
+                     lambda: reader.open_metadata_only(str(self.valid_file), columns=['nope'])):
+            captured_output = StringIO()
+            sys.stdout = captured_output
+            try:
+                self.assertIsNone(read())
+            finally:
+                sys.stdout = sys.__stdout__
+            self.assertIn("Column(s) not found", captured_output.getvalue())
+            self.assertIn("nope", captured_output.getvalue())
+
     def test_invalid_row_range(self):
         """Test error handling for invalid row ranges."""
         reader = ParquetReader(enable_lazy_loading=True)
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+Tests for interactive viewer rendering in pqlens
+"""
+
+import os
+import signal
+import sys
+import unittest
+from contextlib import redirect_stdout
+from io import BytesIO, StringIO, TextIOWrapper
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from pqlens.core.interactive import HAS_READCHAR, InteractiveViewer, readchar, wcswidth
+from pqlens.core.reader import ParquetReader
+from pqlens.formatters.table import TABULATE_AVAILABLE
+from pqlens.utils.terminal import TerminalHelper
+
+
+class TestInteractiveRendering(unittest.TestCase):
+    """Test cases for interactive viewer frame rendering."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_data_dir = Path(__file__).parent / "data"
+        self.df = pd.read_parquet(self.test_data_dir / "large.parquet")
+        # Small enough for the frame to fit the default 24-line terminal used when not attached to one
+        self.page_size = 5
+        self.total_rows = len(self.df)
+        self.total_cols = len(self.df.columns)
+        self.total_pages = (self.total_rows + self.page_size - 1) // self.page_size
+
+    def refresh(self, viewer):
+        """Run a refresh and return everything written to stdout."""
+        output = StringIO()
+        with redirect_stdout(output):
+            viewer._refresh_display(self.page_size, 'grid', self.total_rows, self.total_cols, self.total_pages)
+        return output.getvalue()
+
+    @unittest.skipUnless(HAS_READCHAR, "readchar is needed for key navigation")
+    def test_sessions_over_different_columns_start_afresh(self):
+        """Test that each session counts and lays out only its own selected columns."""
+
+        class QuittingTerminal(TerminalHelper):
+            @staticmethod
+            def read_keys():
+                return ['q']
+
+        file_path = str(self.test_data_dir / "large.parquet")
+        reader = ParquetReader(memory_threshold_mb=0, enable_lazy_loading=True)
+        reader.open_metadata_only(file_path)
+        viewer = InteractiveViewer(df=None, terminal_helper=QuittingTerminal(), parquet_reader=reader,
+                                   file_path=file_path)
+
+        for columns, hidden in [(['id', 'category'], 'value'), (['value'], 'category')]:
+            with self.subTest(columns=columns):
+                output = StringIO()
+                with redirect_stdout(output):
+                    viewer.start_interactive_mode(self.page_size, 'grid', columns=columns)
+
+                table = output.getvalue().split("Navigation:")[1]
+                self.assertIn(f"Columns 1-{len(columns)} of {len(columns)}", table)
+                self.assertIn(columns[-1], table)
+                self.assertNotIn(hidden, table)
+
+    def test_first_frame_clears_screen(self):
+        """Test that the first frame is drawn in full after clearing the screen."""
+        viewer = InteractiveViewer(self.df)
+        output = self.refresh(viewer)
+
+        self.assertTrue(output.startswith(TerminalHelper.BEGIN_SYNC + TerminalHelper.CLEAR_SCREEN),
+                        "First frame should start with a full clear inside a synchronized update")
+        self.assertTrue(output.endswith(TerminalHelper.END_SYNC), "Frame should end the synchronized update")
+        self.assertIn("Showing rows 1-5 of 100", output)
+
+    def test_single_row_scroll_redraws_changed_lines_only(self):
+        """Test that scrolling by one row does not clear and redraw the whole screen."""
+        viewer = InteractiveViewer(self.df)
+        full_output = self.refresh(viewer)
+
+        viewer.start_row += 1
+        partial_output = self.refresh(viewer)
+
+        self.assertNotIn(TerminalHelper.CLEAR_SCREEN, partial_output, "Incremental redraw should not clear the screen")
+        self.assertIn("Showing rows 2-6 of 100", partial_output)
+        self.assertLess(len(partial_output), len(full_output), "Unchanged separator lines should not be rewritten")
+
+    def test_frame_taller_than_terminal_is_redrawn_in_full(self):
+        """Test that a frame which scrolls the terminal is never patched line by line."""
+        viewer = InteractiveViewer(self.df)
+        _, terminal_height = viewer.terminal.get_size()
+        self.page_size = terminal_height
+        self.refresh(viewer)
+
+        viewer.start_row += 1
+        output = self.refresh(viewer)
+
+        self.assertIn(TerminalHelper.CLEAR_SCREEN, output, "Screen lines no longer match frame lines")
+
+    def test_wide_characters_count_double_when_wrapping(self):
+        """Test that lines below wrapped wide-character text are redrawn on the right screen row."""
+
+        class NarrowTerminal(TerminalHelper):
+            @staticmethod
+            def get_size():
+                return 10, 24
+
+        viewer = InteractiveViewer(self.df, terminal_helper=NarrowTerminal())
+        with redirect_stdout(StringIO()):
+            viewer._draw_frame(["日本語日本語", "x"])
+        output = StringIO()
+        with redirect_stdout(output):
+            viewer._draw_frame(["日本語日本語", "y"])
+
+        if wcswidth is None:
+            self.assertIn(TerminalHelper.CLEAR_SCREEN, output.getvalue(), "Unmeasured text is redrawn in full")
+        else:
+            self.assertEqual(InteractiveViewer._display_width("日本a"), 5)
+            self.assertIn(TerminalHelper.move_to_line(3) + TerminalHelper.CLEAR_LINE + "y", output.getvalue(),
+                          "12 cells wrap onto two rows of a 10-column terminal")
+
+    def test_revisited_page_is_served_from_cache(self):
+        """Test that scrolling back to a page reuses its rendered table lines."""
+        viewer = InteractiveViewer(self.df)
+        self.refresh(viewer)
+        first_lines = next(iter(viewer._page_cache.values()))
+
+        viewer.start_row += 1
+        self.refresh(viewer)
+        viewer.start_row -= 1
+        self.refresh(viewer)
+
+        self.assertEqual(len(viewer._page_cache), 2, "Returning to the first page should not render it again")
+        self.assertEqual(viewer._prev_frame[-len(first_lines):], first_lines)
+
+    def test_page_cache_is_bounded(self):
+        """Test that the least recently shown pages are evicted."""
+        viewer = InteractiveViewer(self.df)
+        viewer.page_cache_size = 3
+
+        for start_row in range(5):
+            viewer.start_row = start_row
+            self.refresh(viewer)
+
+        self.assertEqual([key[0] for key in viewer._page_cache], [2, 3, 4])
+
+    def test_unchanged_frame_writes_no_lines(self):
+        """Test that redrawing an identical frame only repositions the cursor."""
+        viewer = InteractiveViewer(self.df)
+        self.refresh(viewer)
+        viewer._last_view_state = None  # Force a redraw of the same view
+        output = self.refresh(viewer)
+
+        self.assertNotIn("Showing rows", output, "Unchanged lines should not be rewritten")
+
+    def test_unchanged_view_is_not_redrawn(self):
+        """Test that refreshing without navigating writes nothing at all."""
+        viewer = InteractiveViewer(self.df)
+        self.refresh(viewer)
+
+        self.assertEqual(self.refresh(viewer), "")
+
+        viewer._prev_frame = None  # e.g. after the text prompt scrolled the screen
+        self.assertIn("Showing rows 1-5", self.refresh(viewer), "A cleared frame is always redrawn")
+
+
+class TestTerminalWrite(unittest.TestCase):
+    """Test cases for frame output."""
+
+    def test_write_encodes_once_after_pending_text(self):
+        """Test that frames go to the binary buffer after earlier prints, replacing unencodable characters."""
+        raw = BytesIO()
+        stream = TextIOWrapper(raw, encoding='ascii')
+        with redirect_stdout(stream):
+            print("before", end="")
+            TerminalHelper.write("\u2191 row\n")
+
+        self.assertEqual(raw.getvalue(), b"before? row\n")
+
+
+@unittest.skipIf(os.name == 'nt', "stdin polling uses select on POSIX")
+class TestTerminalInput(unittest.TestCase):
+    """Test cases for non-blocking keyboard input checks."""
+
+    def setUp(self):
+        """Replace stdin with the read end of a pipe."""
+        read_fd, self.write_fd = os.pipe()
+        self.original_stdin = sys.stdin
+        sys.stdin = os.fdopen(read_fd)
+
+    def tearDown(self):
+        """Restore stdin."""
+        sys.stdin.close()
+        sys.stdin = self.original_stdin
+        os.close(self.write_fd)
+
+    def test_input_pending_reflects_queued_keys(self):
+        """Test that queued input is detected without blocking."""
+        self.assertFalse(TerminalHelper.input_pending())
+
+        os.write(self.write_fd, b"j")
+
+        self.assertTrue(TerminalHelper.input_pending())
+
+    def test_cbreak_input_ignores_non_terminals(self):
+        """Test that cbreak mode is skipped when stdin is not a terminal."""
+        with TerminalHelper.cbreak_input():
+            os.write(self.write_fd, b"k")
+            self.assertTrue(TerminalHelper.input_pending())
+
+
+@unittest.skipIf(os.name == 'nt', "pseudo-terminals are POSIX only")
+class TestTerminalKeyBursts(unittest.TestCase):
+    """Test cases for reading queued keystrokes from a terminal."""
+
+    def setUp(self):
+        """Attach stdin to the slave end of a pseudo-terminal."""
+        import pty
+        self.master_fd, slave_fd = pty.openpty()
+        self.original_stdin = sys.stdin
+        sys.stdin = os.fdopen(slave_fd)
+
+    def tearDown(self):
+        """Restore stdin."""
+        sys.stdin.close()
+        sys.stdin = self.original_stdin
+        os.close(self.master_fd)
+
+    def test_read_keys_returns_whole_burst(self):
+        """Test that queued keys come back together, with escape sequences kept whole."""
+        with TerminalHelper.cbreak_input():
+            os.write(self.master_fd, b"j\x1b[B\x1b[6~l")
+            keys = TerminalHelper.read_keys()
+
+        self.assertEqual(keys, ['j', '\x1b[B', '\x1b[6~', 'l'])
+
+    def test_read_keys_ignores_non_terminals(self):
+        """Test that callers fall back to readchar when stdin is not a terminal."""
+        sys.stdin.close()
+        read_fd, write_fd = os.pipe()
+        sys.stdin = os.fdopen(read_fd)
+        os.close(write_fd)
+
+        self.assertIsNone(TerminalHelper.read_keys())
+
+
+@unittest.skipUnless(hasattr(signal, 'SIGWINCH'), "resize signals are POSIX only")
+class TestTerminalResize(unittest.TestCase):
+    """Test cases for tracking terminal resizes."""
+
+    def test_watch_resize_calls_back_and_restores_handler(self):
+        """Test that resizes are reported only inside the block."""
+        resizes = []
+        previous_handler = signal.getsignal(signal.SIGWINCH)
+
+        with TerminalHelper.watch_resize(lambda: resizes.append(True)) as watching:
+            self.assertTrue(watching)
+            os.kill(os.getpid(), signal.SIGWINCH)
+
+        self.assertEqual(resizes, [True])
+        self.assertIs(signal.getsignal(signal.SIGWINCH), previous_handler)
+
+    def test_viewer_caches_size_until_resize(self):
+        """Test that the viewer queries the terminal again only after a resize."""
+        sizes = iter([(80, 24), (120, 40)])
+
+        class FakeTerminal(TerminalHelper):
+            @staticmethod
+            def get_size():
+                return next(sizes)
+
+        viewer = InteractiveViewer(pd.DataFrame({'a': [1]}), terminal_helper=FakeTerminal())
+        with viewer.terminal.watch_resize(viewer._on_terminal_resize) as watching:
+            viewer._watching_resize = watching
+            self.assertEqual(viewer._get_terminal_size(), (80, 24))
+            self.assertEqual(viewer._get_terminal_size(), (80, 24))
+            os.kill(os.getpid(), signal.SIGWINCH)
+            self.assertEqual(viewer._get_terminal_size(), (120, 40))
+
+
+class TestVisibleColumns(unittest.TestCase):
+    """Test cases for visible column selection."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_data_dir = Path(__file__).parent / "data"
+        self.df = pd.read_parquet(self.test_data_dir / "wide.parquet")
+
+    def test_visible_columns_are_cached(self):
+        """Test that visible columns and widths are computed once per scroll position."""
+        viewer = InteractiveViewer(self.df)
+
+        first = viewer._get_visible_columns()
+        second = viewer._get_visible_columns()
+
+        self.assertGreater(len(first), 0)
+        self.assertLess(len(first), len(self.df.columns), "Wide file should not fit in the terminal")
+        self.assertIs(first, second, "Second lookup should be served from the cache")
+        self.assertTrue(set(first) <= set(viewer._col_width_cache), "Widths should be cached for visited columns")
+
+    def test_visible_columns_follow_scroll_position(self):
+        """Test that scrolling right starts the visible range at the new left column."""
+        viewer = InteractiveViewer(self.df)
+        viewer.left_col_idx = 5
+
+        visible = viewer._get_visible_columns()
+
+        self.assertEqual(visible[0], 5)
+        self.assertEqual(visible, list(range(5, 5 + len(visible))))
+
+
+class TestWidthEstimation(unittest.TestCase):
+    """Test cases for Arrow-based text width measurement."""
+
+    def test_max_text_length(self):
+        """Test that widths are measured on strings, numbers and nested values, ignoring nulls."""
+        self.assertEqual(InteractiveViewer._max_text_length(pa.array(['ab', 'abcd', None])), 4)
+        self.assertEqual(InteractiveViewer._max_text_length(pa.array([1, -22222])), 6)
+        self.assertEqual(InteractiveViewer._max_text_length(pa.array(['\u00e9' * 3])), 3, "Length counts characters, not bytes")
+        self.assertEqual(InteractiveViewer._max_text_length(pa.array([[1, 2], [3]])), len(str(pa.array([[1, 2]]).to_pandas()[0])))
+        self.assertEqual(InteractiveViewer._max_text_length(pa.array([], type=pa.int64())), 0)
+
+
+class TestViewData(unittest.TestCase):
+    """Test cases for in-memory view data selection."""
+
+    def test_view_data_selects_rows_and_columns(self):
+        """Test that a column projection is resolved once and applied with the row slice."""
+        df = pd.read_parquet(Path(__file__).parent / "data" / "large.parquet")
+        viewer = InteractiveViewer(df)
+
+        view = viewer._get_view_data(20, 30, columns=['value', 'id'])
+        viewer._get_view_data(21, 31, columns=['value', 'id'])
+
+        pd.testing.assert_frame_equal(view, df.iloc[20:30][['value', 'id']])
+        self.assertEqual(list(viewer._column_positions_cache), [('value', 'id')])
+
+    def test_view_data_unknown_column(self):
+        """Test that an unknown column name is reported rather than mapped to another column."""
+        viewer = InteractiveViewer(pd.DataFrame({'a': [1, 2]}))
+
+        with self.assertRaises(KeyError):
+            viewer._get_view_data(0, 2, columns=['missing'])
+
+
+class TestKeyActions(unittest.TestCase):
+    """Test cases for the arrow key dispatch table."""
+
+    @unittest.skipUnless(HAS_READCHAR, "readchar not installed")
+    def test_key_actions_cover_arrow_and_letter_keys(self):
+        """Test that arrow keys and their letter alternatives map to the same moves."""
+        viewer = InteractiveViewer(pd.DataFrame({'a': [1, 2, 3]}))
+
+        key_actions = viewer._build_key_actions(page_size=25)
+
+        self.assertEqual(key_actions[readchar.key.DOWN], (1, 0))
+        self.assertEqual(key_actions['j'], key_actions[readchar.key.DOWN])
+        self.assertEqual(key_actions[readchar.key.PAGE_UP], (-25, 0))
+        self.assertEqual(key_actions[readchar.key.LEFT], key_actions['h'])
+        self.assertNotIn('q', key_actions, "Quit keys are handled before dispatch")
+
+    def test_step_position_clamps_to_navigable_range(self):
+        """Test that rows and pages stop at the ends instead of overshooting or moving backwards."""
+        self.assertEqual(InteractiveViewer._step_position(5, 1, 100), 6)
+        self.assertEqual(InteractiveViewer._step_position(99, 1, 100), 99, "Last row cannot move further down")
+        self.assertEqual(InteractiveViewer._step_position(85, 10, 100), 90, "Page down stops at the last full page")
+        self.assertEqual(InteractiveViewer._step_position(95, 10, 100), 95, "Page down never moves backwards")
+        self.assertEqual(InteractiveViewer._step_position(3, -10, 100), 0)
+        self.assertEqual(InteractiveViewer._step_position(0, -1, 100), 0)
+
+    def test_text_page_forward_can_reach_partial_last_page(self):
+        """Test that the text 'f' command pages forward by a whole page while one lies ahead."""
+        viewer = InteractiveViewer(pd.DataFrame({'a': range(100)}))
+        original_stdin = sys.stdin
+        for start_row, expected in [(80, 90), (85, 95), (90, 90)]:
+            with self.subTest(start_row=start_row):
+                viewer.start_row = start_row
+                sys.stdin = StringIO("f\nq\n")
+                try:
+                    with redirect_stdout(StringIO()):
+                        viewer._handle_text_navigation(10, 'grid', 100, 1, 10)
+                finally:
+                    sys.stdin = original_stdin
+                self.assertEqual(viewer.start_row, expected)
+
+
+class TestFormatForDisplay(unittest.TestCase):
+    """Test cases for cell and header truncation."""
+
+    def test_long_values_and_headers_are_truncated(self):
+        """Test that values and headers longer than max_col_width are cut with an ellipsis."""
+        long_name = 'n' * 120
+        df = pd.DataFrame({long_name: ['x' * 150, 'short'], 'num': [1, 2]})
+        viewer = InteractiveViewer(df)
+
+        formatted = viewer._format_for_display(df)
+
+        truncated_name = 'n' * (viewer.max_col_width - 3) + '...'
+        self.assertEqual(list(formatted.columns), [truncated_name, 'num'])
+        self.assertEqual(formatted[truncated_name].iloc[0], 'x' * (viewer.max_col_width - 3) + '...')
+        self.assertEqual(formatted[truncated_name].iloc[1], 'short')
+        self.assertEqual(list(formatted['num']), ['1', '2'])
+        self.assertEqual(list(formatted.index), list(df.index))
+
+
+class TestGridRenderer(unittest.TestCase):
+    """Test cases for the direct grid renderer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_data_dir = Path(__file__).parent / "data"
+
+    def assert_matches_tabulate(self, viewer, df, table_format='grid'):
+        """Assert that the direct renderer reproduces tabulate's output for a table style."""
+        expected = viewer.formatter.format_table(viewer._format_for_display(df), style=table_format,
+                                                 showindex=True).split("\n")
+        self.assertEqual(viewer._render_grid(df, table_format=table_format), expected)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_grid_matches_tabulate_for_test_files(self):
+        """Test that pages of the sample files render exactly as tabulate renders them."""
+        for name in ("simple", "large", "wide", "mixed_types"):
+            df = pd.read_parquet(self.test_data_dir / f"{name}.parquet")
+            viewer = InteractiveViewer(df)
+            for table_format in InteractiveViewer.DIRECT_TABLE_FORMATS:
+                with self.subTest(file=name, table_format=table_format):
+                    self.assert_matches_tabulate(viewer, df.iloc[:10], table_format)
+                    self.assert_matches_tabulate(viewer, df.iloc[-3:], table_format)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_grid_matches_tabulate_for_index_types(self):
+        """Test that label and float indexes are aligned and formatted as tabulate does."""
+        for index in (['r1', 'row2'], [0.5, 10.25]):
+            df = pd.DataFrame({'a': [1, 22], 'b': ['x', 'yy']}, index=index)
+            viewer = InteractiveViewer(df)
+            for table_format in InteractiveViewer.DIRECT_TABLE_FORMATS:
+                with self.subTest(index=index, table_format=table_format):
+                    self.assert_matches_tabulate(viewer, df, table_format)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_numeric_strings_render_as_tabulate_does(self):
+        """Test that text columns tabulate parses as numbers are right aligned and reformatted like tabulate."""
+        df = pd.DataFrame({'code': ['1', '22', '3.50'], 'amount': ['1,000', '250', ''], 'label': ['1', 'x', '2']})
+        viewer = InteractiveViewer(df)
+        for table_format in InteractiveViewer.DIRECT_TABLE_FORMATS:
+            with self.subTest(table_format=table_format):
+                expected = viewer.formatter.format_table(viewer._format_for_display(df), style=table_format,
+                                                         showindex=True).split("\n")
+                self.assertEqual(viewer._render_table(0, len(df), list(df.columns), table_format), expected)
+                self.assert_matches_tabulate(viewer, df[['label']], table_format)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_padded_strings_render_as_tabulate_does(self):
+        """Test that whitespace around text cells and index labels is stripped as tabulate strips it."""
+        df = pd.DataFrame({'padded': [' b', 'abcdef   ', 'x'], 'n': [1, 2, 3]}, index=[' i', 'j', 'k '])
+        viewer = InteractiveViewer(df)
+        for table_format in InteractiveViewer.DIRECT_TABLE_FORMATS:
+            with self.subTest(table_format=table_format):
+                expected = viewer.formatter.format_table(viewer._format_for_display(df), style=table_format,
+                                                         showindex=True).split("\n")
+                self.assertEqual(viewer._render_table(0, len(df), list(df.columns), table_format), expected)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_wide_characters_render_as_tabulate_does(self):
+        """Test that pages with non-ASCII text are laid out by tabulate's display-width measurement."""
+        df = pd.DataFrame({'名前': ['日本', 'abc'], 'n': [1, 2]})
+        viewer = InteractiveViewer(df)
+
+        self.assertIsNone(viewer._render_grid(df), "Only ASCII pages are rendered directly")
+        expected = viewer.formatter.format_table(viewer._format_for_display(df), showindex=True).split("\n")
+        self.assertEqual(viewer._render_table(0, len(df), list(df.columns), 'grid'), expected)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_grid_matches_tabulate_for_number_formats(self):
+        """Test float formatting, decimal alignment and nullable columns."""
+        df = pd.DataFrame({
+            'neg': [-1.5, 2.25],
+            'big': [1e20, 2.0],
+            'special': [float('nan'), float('inf')],
+            'nullable': pd.array([1, None], dtype='Int64'),
+            'flag': [True, False],
+            'text': ['x' * 150, 'y'],
+        })
+        viewer = InteractiveViewer(df)
+
+        self.assert_matches_tabulate(viewer, df)
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_grid_matches_tabulate_for_arrow_strings(self):
+        """Test that Arrow-backed strings from lazy loading render like pandas strings."""
+        df = pd.DataFrame({
+            'name': pd.array(['short', None, 'y' * 150], dtype=pd.StringDtype("pyarrow")),
+            'count': pd.array([3, 40, 500], dtype='uint16'),
+        })
+        viewer = InteractiveViewer(df)
+
+        self.assert_matches_tabulate(viewer, df)
+        self.assertEqual(InteractiveViewer._stringify(df['name']).tolist(), df['name'].astype(str).tolist())
+
+    @unittest.skipUnless(TABULATE_AVAILABLE, "tabulate not installed")
+    def test_cached_cell_text_matches_tabulate(self):
+        """Test that pages served from the block text cache render exactly like fresh pages."""
+        df = pd.read_parquet(self.test_data_dir / "large.parquet")
+        viewer = InteractiveViewer(df)
+        viewer.text_block_rows = 8
+
+        for start_row in (0, 5, 6, 90):
+            page = df.iloc[start_row:start_row + 10]
+            expected = viewer.formatter.format_table(viewer._format_for_display(page), style='grid', showindex=True).split("\n")
+            with self.subTest(start_row=start_row):
+                self.assertEqual(viewer._render_grid(page, start_row), expected)
+
+        cached_columns = {col_pos for col_pos, _ in viewer._text_cache}
+        self.assertEqual(cached_columns, {0, 1, 2}, "Timestamps depend on neighbouring values and are not cached")
+
+    def test_grid_templates_are_reused(self):
+        """Test that scrolling with unchanged column widths reuses the row template."""
+        df = pd.read_parquet(self.test_data_dir / "large.parquet")
+        viewer = InteractiveViewer(df)
+
+        viewer._render_grid(df.iloc[10:20])
+        viewer._render_grid(df.iloc[11:21])
+
+        self.assertEqual(len(viewer._grid_template_cache), 1)
+
+    def test_grid_defers_empty_and_multiline_pages(self):
+        """Test that pages the renderer cannot lay out are left to the formatter."""
+        viewer = InteractiveViewer(pd.DataFrame({'a': ['one', 'two']}))
+
+        self.assertIsNone(viewer._render_grid(pd.DataFrame({'a': []})))
+        self.assertIsNone(viewer._render_grid(pd.DataFrame({'a': ['line\nbreak']})))
+
+if __name__ == '__main__':
+    unittest.main()
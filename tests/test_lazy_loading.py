@@ -111,6 +111,213 @@ class TestLazyLoading(unittest.TestCase):
         self.assertEqual(len(df_range), 100, "Row range should contain exactly 100 rows")  # 200 - 100 = 100 rows
         self.assertEqual(df_range.iloc[0]['id'], 100, "First row should have id 100 when starting at row 100")  # First row should have id 100
 
+    def test_parquet_reader_row_range_across_row_groups(self):
+        """Test that a row range spanning row groups matches slicing the whole file."""
+        multi_group_file = self.temp_dir / "row_groups.parquet"
+        full_df = pd.DataFrame({'id': range(1000)}, index=pd.RangeIndex(5000, 7000, 2))
+        full_df.to_parquet(multi_group_file, row_group_size=300)
+
+        try:
+            for enable_lazy_loading in (False, True):
+                reader = ParquetReader(memory_threshold_mb=0, enable_lazy_loading=enable_lazy_loading)
+                for row_range in [(10, 250), (250, 650), (299, 301), (-10, None), (500, 400)]:
+                    with self.subTest(enable_lazy_loading=enable_lazy_loading, row_range=row_range):
+                        captured_output = StringIO()
+                        sys.stdout = captured_output
+                        try:
+                            df = reader.read_file(str(multi_group_file), row_range=row_range)
+                        finally:
+                            sys.stdout = sys.__stdout__
+
+                        pd.testing.assert_frame_equal(df, full_df.iloc[slice(*row_range)])
+        finally:
+            multi_group_file.unlink()
+
+    def test_parquet_reader_row_range_from_dataset_directory(self):
+        """Test that a row range over a directory of Parquet files matches slicing the whole dataset."""
+        dataset_dir = self.temp_dir / "dataset"
+        dataset_dir.mkdir()
+        parts = [dataset_dir / f"part_{i}.parquet" for i in range(2)]
+        for i, part in enumerate(parts):
+            pd.DataFrame({'id': range(i * 10, i * 10 + 10)},
+                         index=pd.Index([f'k{j}' for j in range(i * 10, i * 10 + 10)], name='key')).to_parquet(part)
+
+        try:
+            reader = ParquetReader(enable_lazy_loading=False)
+            captured_output = StringIO()
+            sys.stdout = captured_output
+            try:
+                full_df = reader.read_file(str(dataset_dir), columns=['id'])
+                for row_range in [(5, 15), (-3, None), (0, 4)]:
+                    with self.subTest(row_range=row_range):
+                        df = reader.read_file(str(dataset_dir), columns=['id'], row_range=row_range)
+                        pd.testing.assert_frame_equal(df, full_df.iloc[slice(*row_range)])
+            finally:
+                sys.stdout = sys.__stdout__
+        finally:
+            for part in parts:
+                part.unlink()
+            dataset_dir.rmdir()
+
+    def test_parquet_reader_reuses_handle_for_unchanged_file(self):
+        """Test that repeated reads of an unchanged file share one handle and row group index."""
+        reader = ParquetReader(enable_lazy_loading=False)
+        reader.read_file(str(self.large_lazy_file), row_range=(10, 20))
+        parquet_file = reader.get_parquet_file(str(self.large_lazy_file))
+        offsets = reader._row_group_offsets
+
+        df = reader.read_file(str(self.large_lazy_file), row_range=(20, 30))
+
+        self.assertEqual(df['id'].iloc[0], 20)
+        self.assertIs(reader.get_parquet_file(str(self.large_lazy_file)), parquet_file)
+        self.assertIs(reader._row_group_offsets, offsets, "Row group offsets should be computed once per file")
+
+        # Rewriting the file invalidates the handle
+        pd.DataFrame({'id': range(5)}).to_parquet(self.large_lazy_file, index=False)
+        os.utime(self.large_lazy_file, ns=(0, 0))
+        df = reader.read_file(str(self.large_lazy_file))
+        self.assertEqual(list(df.columns), ['id'])
+        self.assertEqual(len(df), 5)
+
+    def test_parquet_reader_arrow_backed_strings(self):
+        """Test that string columns are read as Arrow-backed strings rather than objects."""
+        for enable_lazy_loading in (False, True):
+            with self.subTest(enable_lazy_loading=enable_lazy_loading):
+                reader = ParquetReader(memory_threshold_mb=0.1, enable_lazy_loading=enable_lazy_loading)
+                captured_output = StringIO()
+                sys.stdout = captured_output
+                try:
+                    df = reader.read_file(str(self.large_lazy_file))
+                finally:
+                    sys.stdout = sys.__stdout__
+
+                self.assertEqual(df['name'].dtype, pd.StringDtype("pyarrow"))
+                self.assertEqual(df['name'].iloc[5], 'user_5')
+                self.assertTrue(pd.api.types.is_float_dtype(df['value']), "Numeric columns stay numpy-backed")
+
+    def test_parquet_reader_read_head(self):
+        """Test reading only the first rows of a file."""
+        reader = ParquetReader(enable_lazy_loading=False)
+
+        df = reader.read_head(str(self.large_lazy_file), 5, columns=['id', 'name'])
+
+        self.assertEqual(list(df.columns), ['id', 'name'])
+        self.assertEqual(list(df['id']), [0, 1, 2, 3, 4])
+        self.assertEqual(reader.get_file_info()['num_rows'], 10000, "File info should describe the whole file")
+        self.assertEqual(len(reader.read_head(str(self.large_lazy_file), 0)), 0)
+
+    def test_parquet_reader_iter_batches(self):
+        """Test streaming a file as consecutive DataFrames."""
+        reader = ParquetReader()
+
+        batches = list(reader.iter_batches(str(self.large_lazy_file), columns=['id', 'name'], batch_size=3000))
+
+        self.assertEqual([len(batch) for batch in batches], [3000, 3000, 3000, 1000])
+        self.assertEqual(list(batches[0].columns), ['id', 'name'])
+        combined = pd.concat(batches)
+        self.assertTrue((combined.index == combined['id']).all(), "Indexes should continue across batches")
+
+    def test_parquet_reader_iter_batches_matches_read_file(self):
+        """Test that concatenated batches equal read_file, keeping stored indexes and column types."""
+        indexed_file = self.temp_dir / "indexed.parquet"
+        data = {'id': range(1000), 'cat': np.random.choice(['A', 'B', 'C'], 1000), 'f': np.random.randn(1000)}
+        try:
+            for index in (pd.Index([f't{i}' for i in range(1000)], name='txt'), pd.RangeIndex(5, 2005, 2)):
+                with self.subTest(index=index.name or 'range'):
+                    pd.DataFrame(data, index=index).to_parquet(indexed_file, row_group_size=400)
+                    reader = ParquetReader(enable_lazy_loading=False)
+
+                    expected = reader.read_file(str(indexed_file))
+                    combined = pd.concat(reader.iter_batches(str(indexed_file), batch_size=300))
+
+                    pd.testing.assert_frame_equal(combined, expected)
+
+            captured_output = StringIO()
+            sys.stdout = captured_output
+            try:
+                self.assertEqual(list(reader.iter_batches(str(indexed_file), columns=['nope'])), [])
+            finally:
+                sys.stdout = sys.__stdout__
+            self.assertIn("Column(s) not found", captured_output.getvalue())
+        finally:
+            indexed_file.unlink()
+
+    def test_parquet_reader_preview_reads_first_batch(self):
+        """Test the out-of-memory fallback that loads only the first rows."""
+        reader = ParquetReader()
+        captured_output = StringIO()
+        sys.stdout = captured_output
+        try:
+            df = reader._read_preview(str(self.large_lazy_file), columns=['id', 'name'], batch_size=250)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(len(df), 250, "Only the first batch should be loaded")
+        self.assertEqual(list(df.columns), ['id', 'name'])
+        self.assertEqual(df['id'].iloc[-1], 249)
+        self.assertIn("Loaded only the first 250 of 10,000 rows", captured_output.getvalue())
+
+    def test_parquet_reader_shares_open_file(self):
+        """Test that the handle opened by read_file is offered only for the same path."""
+        reader = ParquetReader(enable_lazy_loading=False)
+        self.assertIsNone(reader.get_parquet_file(str(self.large_lazy_file)))
+
+        reader.read_file(str(self.large_lazy_file), columns=['id'])
+
+        parquet_file = reader.get_parquet_file(str(self.large_lazy_file))
+        self.assertIsNotNone(parquet_file, "Handle should be reusable for the file just read")
+        self.assertEqual(parquet_file.metadata.num_rows, 10000)
+        self.assertIsNone(reader.get_parquet_file(str(self.large_file)), "Handle belongs to another file")
+
+    def test_parquet_reader_low_cardinality_strings_as_categorical(self):
+        """Test that dictionary-encoded string columns with few distinct values are read as categoricals."""
+        expected = pd.read_parquet(self.large_lazy_file)
+        reader = ParquetReader(enable_lazy_loading=False)
+
+        for row_range in [None, (9990, 10000)]:
+            with self.subTest(row_range=row_range):
+                df = reader.read_file(str(self.large_lazy_file), row_range=row_range)
+                expected_rows = expected.iloc[slice(*row_range)] if row_range else expected
+
+                self.assertIsInstance(df['category'].dtype, pd.CategoricalDtype)
+                self.assertEqual(df['category'].astype(str).tolist(), expected_rows['category'].tolist())
+                self.assertEqual(df['name'].dtype, pd.StringDtype("pyarrow"), "Distinct values stay strings")
+
+        sampling_reader = ParquetReader(enable_lazy_loading=False)
+        sampling_reader.categorical_sample_row_groups = 1
+        self.assertIsInstance(sampling_reader.read_file(str(self.large_lazy_file))['category'].dtype,
+                              pd.CategoricalDtype, "A single sampled row group is enough to decide")
+
+    def test_parquet_reader_open_metadata_only(self):
+        """Test that the footer can be opened for lazy paging without reading data."""
+        reader = ParquetReader(enable_lazy_loading=True)
+
+        file_info = reader.open_metadata_only(str(self.large_lazy_file))
+
+        self.assertEqual(file_info['num_rows'], 10000)
+        self.assertEqual(file_info['num_columns'], 6)
+        self.assertIs(reader.get_file_info(), file_info)
+        self.assertIsNotNone(reader.get_parquet_file(str(self.large_lazy_file)))
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+        try:
+            self.assertIsNone(reader.open_metadata_only(str(self.temp_dir / "missing.parquet")))
+        finally:
+            sys.stdout = sys.__stdout__
+        self.assertIn("File not found", captured_output.getvalue())
+
+    def test_parquet_reader_empty_file_from_metadata(self):
+        """Test that files without rows keep their schema and honour column selection."""
+        reader = ParquetReader(enable_lazy_loading=False)
+
+        df = reader.read_file(str(self.test_data_dir / "empty.parquet"), columns=['col2'])
+
+        self.assertIsNotNone(df, "Empty file should still produce a DataFrame")
+        self.assertEqual(len(df), 0, "Empty file should have no rows")
+        self.assertEqual(list(df.columns), ['col2'], "Only selected columns should be present")
+        self.assertEqual(str(df['col2'].dtype), 'float64', "Column dtype should come from the schema")
+
     def test_parquet_reader_lazy_loading_with_metadata(self):
         """Test that lazy loading provides file metadata without loading full data."""
         reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
@@ -195,13 +402,209 @@ class TestLazyLoading(unittest.TestCase):
         chunk1 = viewer._get_view_data(0, 10)
         chunk2 = viewer._get_view_data(0, 10)
         
-        # Should be cached
-        self.assertEqual(len(viewer.cached_chunks), 1, "Exactly one chunk should be cached")
-        self.assertTrue((0, 10) in viewer.cached_chunks, "Requested chunk should be in cache")
+        # Should be cached by row group, not by requested range
+        self.assertEqual(len(viewer.cached_chunks), 1, "Exactly one row group should be cached")
+        self.assertTrue(0 in viewer.cached_chunks, "Row group covering the requested rows should be in cache")
+        
+        # Scrolling by one row should be served from the same cached row group
+        chunk3 = viewer._get_view_data(1, 11)
+        self.assertEqual(len(viewer.cached_chunks), 1, "Overlapping range should reuse the cached row group")
+        self.assertEqual(chunk3.iloc[0]['id'], 1, "Scrolled chunk should start at row 1")
         
         # Chunks should be identical
         pd.testing.assert_frame_equal(chunk1, chunk2, "Cached chunks should be identical")
 
+    def test_interactive_viewer_range_across_row_groups(self):
+        """Test that view data spanning a row group boundary is stitched together."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        multi_rg_file = self.temp_dir / "multi_row_group.parquet"
+        table = pa.Table.from_pandas(pd.read_parquet(self.large_lazy_file), preserve_index=False)
+        pq.write_table(table, multi_rg_file, row_group_size=1000)
+
+        try:
+            reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
+            reader.read_file(str(multi_rg_file))
+            viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(multi_rg_file))
+
+            chunk = viewer._get_view_data(995, 1005)
+
+            self.assertEqual(len(chunk), 10, "Chunk spanning two row groups should contain all requested rows")
+            self.assertEqual(list(chunk['id']), list(range(995, 1005)), "Rows should be contiguous across the boundary")
+            self.assertEqual(list(chunk.index), list(range(995, 1005)), "Index should reflect absolute row numbers")
+            self.assertEqual(sorted(viewer.cached_chunks), [0, 1], "Both overlapping row groups should be cached")
+
+            # Release the memory-mapped handle so the file can be removed on all platforms
+            viewer.close()
+        finally:
+            multi_rg_file.unlink()
+
+    def test_interactive_viewer_reads_only_visible_columns(self):
+        """Test that a lazy refresh decodes only the columns that fit on screen."""
+        reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
+        reader.read_file(str(self.large_lazy_file))
+        viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(self.large_lazy_file))
+
+        output = StringIO()
+        original_stdout = sys.stdout
+        sys.stdout = output
+        try:
+            viewer._refresh_display(10, 'grid', 10000, 6, 1000)
+        finally:
+            sys.stdout = original_stdout
+
+        column_names = viewer._get_column_names()
+        visible_names = [column_names[i] for i in viewer._get_visible_columns()]
+        self.assertEqual(viewer.cached_chunks[0].column_names, visible_names,
+                         "Only the visible columns should have been read from the row group")
+        self.assertIn("Showing rows 1-10", output.getvalue())
+
+    def test_interactive_viewer_memory_probe_is_throttled(self):
+        """Test that the status line reuses the memory reading between probes."""
+        reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
+        reader.read_file(str(self.large_lazy_file))
+        viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(self.large_lazy_file))
+        viewer.memory_probe_interval = 60
+
+        first = viewer._get_memory_usage_mb()
+        probed_at = viewer._memory_probed_at
+        second = viewer._get_memory_usage_mb()
+
+        self.assertEqual(first, second)
+        self.assertEqual(viewer._memory_probed_at, probed_at, "Second call within the interval should not probe again")
+
+        viewer.memory_probe_interval = 0
+        viewer._get_memory_usage_mb()
+        self.assertGreaterEqual(viewer._memory_probed_at, probed_at, "Expired interval should probe again")
+
+    def test_interactive_viewer_keeps_stored_index(self):
+        """Test that lazily viewed pages keep the file's stored index as row labels."""
+        labelled_file = self.temp_dir / "labelled.parquet"
+        ranged_file = self.temp_dir / "ranged.parquet"
+        data = {'a': range(5), 'b': [f'v{i}' for i in range(5)]}
+        pd.DataFrame(data, index=pd.Index([f'r{i}' for i in range(1, 6)], name='key')).to_parquet(labelled_file)
+        pd.DataFrame(data, index=pd.RangeIndex(10, 15)).to_parquet(ranged_file)
+        try:
+            for file_path, expected_index in [(labelled_file, ['r2', 'r3', 'r4']), (ranged_file, [11, 12, 13])]:
+                with self.subTest(file=file_path.name):
+                    reader = ParquetReader(memory_threshold_mb=0, enable_lazy_loading=True)
+                    reader.open_metadata_only(str(file_path))
+                    viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(file_path))
+
+                    self.assertEqual(viewer._get_column_names(), ['a', 'b'])
+                    view = viewer._get_view_data(1, 4)
+                    self.assertEqual(list(view.columns), ['a', 'b'])
+                    self.assertEqual(list(view.index), expected_index)
+                    viewer.close()
+        finally:
+            labelled_file.unlink()
+            ranged_file.unlink()
+
+    def test_interactive_viewer_dtypes_from_schema(self):
+        """Test that lazy column types come from the schema without reading data."""
+        reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
+        reader.read_file(str(self.large_lazy_file))
+        viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(self.large_lazy_file))
+
+        dtypes_repr = viewer._get_dtypes_repr()
+
+        self.assertIn("id", dtypes_repr)
+        self.assertIn("int64", dtypes_repr)
+        self.assertEqual(len(dtypes_repr.splitlines()), 6, "There should be one line per column")
+        self.assertNotIn("dictionary", dtypes_repr, "Categorical columns should show the file's own type")
+        self.assertIs(viewer._get_dtypes_repr(), dtypes_repr, "Rendered types should be cached")
+        self.assertEqual(len(viewer.cached_chunks), 0, "No row group should be read to render types")
+
+    def test_interactive_viewer_summarizes_wide_schema(self):
+        """Test that files wider than MAX_SUMMARY_COLUMNS list only their first column types up front."""
+        wide_file = self.temp_dir / "wide.parquet"
+        pd.DataFrame({f'col_{i}': range(3) for i in range(50)}).to_parquet(wide_file, index=False)
+        try:
+            reader = ParquetReader(memory_threshold_mb=0, enable_lazy_loading=True)
+            reader.open_metadata_only(str(wide_file))
+            lazy_viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(wide_file))
+            memory_viewer = InteractiveViewer(pd.read_parquet(wide_file))
+
+            for viewer in (lazy_viewer, memory_viewer):
+                summary = viewer._get_dtypes_summary().splitlines()
+
+                self.assertEqual(len(summary), InteractiveViewer.SUMMARY_PREVIEW_COLUMNS + 1)
+                self.assertIn("col_19", summary[-2])
+                self.assertIn("30 more columns", summary[-1])
+                self.assertEqual(len(viewer._get_dtypes_repr().splitlines()), 50, "'?' lists every column")
+            self.assertEqual(len(lazy_viewer.cached_chunks), 0, "No row group should be read to render types")
+        finally:
+            wide_file.unlink()
+
+    def test_interactive_viewer_prefetches_next_row_group(self):
+        """Test that serving a row group starts decoding the next one in the background."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        multi_rg_file = self.temp_dir / "prefetch.parquet"
+        table = pa.Table.from_pandas(pd.read_parquet(self.large_lazy_file), preserve_index=False)
+        pq.write_table(table, multi_rg_file, row_group_size=1000)
+
+        try:
+            reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
+            reader.read_file(str(multi_rg_file))
+            viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(multi_rg_file))
+
+            viewer._get_view_data(0, 10)
+            self.assertIn(1, viewer._prefetch_futures, "Next row group should be prefetched after serving row group 0")
+
+            chunk = viewer._get_view_data(1000, 1010)
+            self.assertEqual(chunk.iloc[0]['id'], 1000, "Prefetched row group should serve correct rows")
+            self.assertNotIn(1, viewer._prefetch_futures, "Prefetched row group should be moved into the cache")
+            self.assertIn(1, viewer.cached_chunks)
+
+            # A page spanning a cached and a prefetched row group joins them (same schema,
+            # including the low-cardinality column decoded as a dictionary)
+            chunk = viewer._get_view_data(1995, 2005)
+            self.assertIsNotNone(chunk, "Cached and prefetched row groups should be joined")
+            self.assertEqual(chunk['id'].tolist(), list(range(1995, 2005)))
+            self.assertIsInstance(chunk['category'].dtype, pd.CategoricalDtype)
+
+            # Scrolling back up prefetches the previous row group instead
+            viewer._get_view_data(5000, 5010)
+            viewer._get_view_data(4990, 5000)
+            self.assertIn(3, viewer._prefetch_futures, "Upward scroll should prefetch the previous row group")
+
+            viewer.close()
+            self.assertEqual(len(viewer.cached_chunks), 0, "Closing the viewer should release cached row groups")
+        finally:
+            multi_rg_file.unlink()
+
+    def test_interactive_viewer_cache_budget(self):
+        """Test that the row group cache evicts least recently used groups over budget."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        multi_rg_file = self.temp_dir / "cache_budget.parquet"
+        table = pa.Table.from_pandas(pd.read_parquet(self.large_lazy_file), preserve_index=False)
+        pq.write_table(table, multi_rg_file, row_group_size=1000)
+
+        try:
+            reader = ParquetReader(memory_threshold_mb=1, enable_lazy_loading=True)
+            reader.read_file(str(multi_rg_file))
+            viewer = InteractiveViewer(df=None, parquet_reader=reader, file_path=str(multi_rg_file))
+
+            viewer._get_view_data(0, 10)
+            row_group_bytes = viewer.cached_chunks[0].nbytes
+            viewer.cache_budget_bytes = int(row_group_bytes * 2.5)  # Room for two row groups, not three
+
+            viewer._get_view_data(1000, 1010)
+            viewer._get_view_data(0, 10)  # Touch row group 0 so row group 1 becomes least recently used
+            viewer._get_view_data(2000, 2010)
+
+            self.assertEqual(list(viewer.cached_chunks), [0, 2], "Least recently used row group should be evicted")
+            self.assertLessEqual(viewer._cached_bytes, viewer.cache_budget_bytes)
+
+            viewer.close()
+        finally:
+            multi_rg_file.unlink()
+
     def test_error_handling_lazy_loading(self):
         """Test error handling in lazy loading scenarios."""
         reader = ParquetReader(enable_lazy_loading=True)
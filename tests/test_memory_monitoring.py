@@ -75,6 +75,29 @@ class TestMemoryMonitoring(unittest.TestCase):
         self.assertIsInstance(after_load_memory, float, "Memory after loading should be returned as float")
         self.assertGreater(after_load_memory, 0, "Memory after loading should be positive")
 
+    def test_available_memory_is_cached(self):
+        """Test that available memory is re-read from the system only after the TTL expires."""
+        probes = []
+
+        class CountingReader(ParquetReader):
+            """Reader whose memory probe reports a new figure on every system read."""
+
+            @staticmethod
+            def _probe_available_memory_mb():
+                probes.append(True)
+                return 1000.0 + len(probes)
+
+        reader = CountingReader()
+        reader.available_memory_ttl = 3600
+
+        self.assertEqual(reader.get_available_memory_mb(), 1001.0)
+        self.assertEqual(reader.get_available_memory_mb(), 1001.0, "Cached value should be served within the TTL")
+        self.assertEqual(len(probes), 1)
+
+        reader.available_memory_ttl = 0
+        self.assertEqual(reader.get_available_memory_mb(), 1002.0, "Expired value should be refreshed")
+        self.assertEqual(len(probes), 2)
+
     def test_memory_threshold_calculation(self):
         """Test memory threshold calculations for lazy loading."""
         reader = ParquetReader(memory_threshold_mb=50)
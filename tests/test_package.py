@@ -3,6 +3,8 @@
 Tests for package structure and imports
 """
 
+import subprocess
+import sys
 import unittest
 
 
@@ -29,6 +31,14 @@ class TestPackage(unittest.TestCase):
         self.assertTrue(hasattr(pqlens, 'display_table'))
         self.assertTrue(hasattr(pqlens, 'paged_display'))
 
+    def test_package_import_does_not_load_pandas(self):
+        """Test that importing the package defers heavy dependencies until first use."""
+        code = "import sys, pqlens; print('pandas' in sys.modules); pqlens.ParquetReader; print('pandas' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(), ['False', 'True'])
+
     def test_submodule_imports(self):
         """Test that submodules can be imported."""
         # Test main module
@@ -11,6 +11,9 @@ from pathlib import Path
 
 import pandas as pd
 
+from pqlens.core.display import DataFrameDisplay
+from pqlens.formatters.formatter import Formatter
+from pqlens.formatters.simple import SimpleFormatter
 from pqlens.main import view_parquet_file, display_table
 
 
@@ -113,6 +116,25 @@ class TestParquetViewer(unittest.TestCase):
         finally:
             sys.stdout = sys.__stdout__
 
+    def test_display_table_from_file_path(self):
+        """Test displaying the first rows straight from a file."""
+        # Capture stdout
+        captured_output = StringIO()
+        sys.stdout = captured_output
+
+        try:
+            display_table(None, rows=2, file_path=str(self.simple_file))
+            output = captured_output.getvalue()
+
+            # Shape should describe the whole file, not just the rows read
+            self.assertIn("Parquet file shape: (3, 3)", output)
+            self.assertIn("First 2 rows:", output)
+            self.assertIn("Bob", output)
+            self.assertNotIn("Charlie", output)
+
+        finally:
+            sys.stdout = sys.__stdout__
+
     def test_display_table_empty(self):
         """Test displaying an empty table."""
         df = view_parquet_file(str(self.empty_file))
@@ -166,6 +188,46 @@ class TestParquetViewer(unittest.TestCase):
         finally:
             sys.stdout = sys.__stdout__
 
+    def test_display_table_simple_formatter_row_limit(self):
+        """Test that the fallback formatter renders only the rows shown."""
+        df = pd.DataFrame({'id': range(100), 'name': [f'row_{i}' for i in range(100)]})
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+
+        try:
+            DataFrameDisplay(formatter=SimpleFormatter()).show_table(df, rows=3)
+            output = captured_output.getvalue()
+
+            self.assertIn("row_2", output)
+            self.assertNotIn("row_3", output)
+            self.assertNotIn("...", output)
+
+        finally:
+            sys.stdout = sys.__stdout__
+
+    def test_display_table_custom_formatter_gets_only_shown_rows(self):
+        """Test that formatters which ignore max_rows still receive only the rows shown."""
+
+        class FullFormatter(Formatter):
+            def format_table(self, df, max_rows=None, **kwargs):
+                return df.to_string()
+
+        df = pd.DataFrame({'id': range(1000), 'name': [f'row_{i}' for i in range(1000)]})
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+
+        try:
+            DataFrameDisplay(formatter=FullFormatter()).show_table(df, rows=3)
+            output = captured_output.getvalue()
+
+            self.assertIn("row_2", output)
+            self.assertNotIn("row_3", output)
+
+        finally:
+            sys.stdout = sys.__stdout__
+
 
 if __name__ == '__main__':
     unittest.main()